@@ -37,13 +37,17 @@ class WindClientConfig(BaseModel):
         default=list(range(0, 385, 3)),
         description="Forecast hours to fetch (0 to 384 by 3-hour steps)"
     )
-    rate_limit: Dict[str, int] = Field(
-        default={
-            "requests_per_minute": 120,
-            "batch_size": 30,
-            "batch_pause": 15
-        },
-        description="Rate limiting configuration"
+    subregion_margin: float = Field(
+        default=2.0,
+        description="Degrees added around a region's stations when downloading its subregion"
+    )
+    backfill_retry_minutes: int = Field(
+        default=10,
+        description="Minutes between retries of overdue or failed forecast hours"
+    )
+    backfill_window_hours: int = Field(
+        default=6,
+        description="Hours after a run becomes available to keep backfilling missing forecast hours"
     )
 
 class Settings(BaseSettings):
@@ -52,6 +56,50 @@ class Settings(BaseSettings):
     # Redis settings
     redis_url: str = "redis://localhost:6379"
     
+    # NOMADS request budget shared by the wave and wind GRIB downloads
+    nomads_rate_limit: Dict[str, int] = {
+        "requests_per_minute": 120,
+        "burst": 5,                     # Requests allowed back-to-back before throttling
+        "max_concurrent_downloads": 4   # Downloads kept in flight per region
+    }
+    
+    # How GRIB files are fetched from NOMADS:
+    #   "filter"     - server-side subsetting through the filter_*.pl CGI
+    #   "byte_range" - .idx inventory plus HTTP Range requests against base_url
+    grib_download_mode: str = "filter"
+    
+    # Worker processes that decode GRIB files off the event loop
+    decode_workers: int = 2
+    
+    # Hold resident forecast grids as uint16 fixed point (see forecast_grid.QUANTIZATION)
+    # instead of float32, halving their memory at a bounded loss of precision
+    compact_grids: bool = False
+    
+    # Serve a new model run once its early forecast hours are loaded, stitching
+    # later hours from the previous run until the new run is complete
+    progressive_serving: Dict[str, Any] = {
+        "enabled": True,
+        "early_forecast_hours": 48
+    }
+    
+    # Pointer to the last fully loaded model run, restored from its decoded stores
+    # at startup so the API serves within seconds instead of waiting on NOMADS
+    run_snapshot_path: str = "downloaded_data/run_snapshot.json"
+    
+    # With several API workers, the worker holding this lock downloads model runs and
+    # the others restore each run it completes, checking the snapshot this often
+    ingest_lock_path: str = "downloaded_data/ingest.lock"
+    ingest_follow_seconds: int = 30
+    
+    # New model run discovery: sleep until shortly before the next cycle's expected
+    # publication, then poll with backoff until it appears
+    model_run_polling: Dict[str, int] = {
+        "lead_seconds": 120,              # Start polling this long before the expected time
+        "initial_interval_seconds": 15,
+        "max_interval_seconds": 60,
+        "retry_seconds": 300              # Wait after a failed prefetch before trying again
+    }
+    
     # GFS Wave Bulletin settings
     gfs_wave_base_url: str = "https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod"
     gfs_wave_filter_url: str = "https://nomads.ncep.noaa.gov/cgi-bin"
@@ -62,6 +110,8 @@ class Settings(BaseSettings):
     data_dir: str = "data"
     cache_dir: str = "cache"  # Directory for GRIB file caching
 
+    # Response cache backend: "memory" (per worker), "redis" (shared by all workers
+    # through redis_url) or "fakeredis" (the Redis code path against an in-process server)
     cache: Dict[str, Any] = {
         "enabled": True,
         "backend": "memory",
@@ -69,6 +119,16 @@ class Settings(BaseSettings):
     }
     
     # NDBC settings
+    # A background poller refreshes every station's observation shortly after NDBC publishes,
+    # from the bulk latest_obs.txt feed with per-station fetches for stations missing from it
+    ndbc_observation_polling: Dict[str, Any] = {
+        "update_minutes": [26, 56],     # Minutes past the hour NDBC publishes observations
+        "delay_seconds": 60,            # Give NDBC time to finish publishing
+        "use_latest_obs": True,
+        "max_concurrency": 8,           # Per-station fetches in flight at once
+        "retry_seconds": 120            # Retry failed stations before the next publish time
+    }
+    ndbc_latest_obs_url: str = "https://www.ndbc.noaa.gov/data/latest_obs/latest_obs.txt"
     ndbc_base_url: str = "https://www.ndbc.noaa.gov/data/realtime2/"
     ndbc_data_types: Dict[str, str] = {
         "std": "txt",           # Standard meteorological data
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, date, time, timezone, timedelta
-from typing import Optional, Tuple, ClassVar, List
+from typing import Callable, Optional, Tuple, ClassVar, List
 from pydantic import BaseModel, validator
 
 logger = logging.getLogger(__name__)
@@ -79,6 +79,48 @@ class ModelRun(BaseModel):
         ).replace(tzinfo=timezone.utc)
         return run_start + timedelta(hours=self.TYPICAL_PUBLISH_DELAY)
 
+    @property
+    def next_expected_available_time(self) -> datetime:
+        """Calculate when the cycle after this one is expected to be available."""
+        cycle_interval = timedelta(hours=24 // len(self.VALID_CYCLES))
+        return self.expected_available_time + cycle_interval
+
+    def is_newer_than(self, other: "ModelRun") -> bool:
+        """Check if this run's cycle starts after another run's."""
+        return (self.run_date, self.cycle_hour) > (other.run_date, other.cycle_hour)
+
     def __str__(self):
         return (f"ModelRun(run_date={self.local_date}, cycle_hour={self.cycle_hour}Z, "
-                f"available_time={self.local_time})")
\ No newline at end of file
+                f"available_time={self.local_time})")
+
+class ForecastSegment(BaseModel):
+    """Span of a forecast served from one model run."""
+    model_run: ModelRun
+    start: datetime
+    end: datetime
+
+    @property
+    def forecast_hours(self) -> Tuple[int, int]:
+        """Get the first and last forecast hour of the span relative to its run."""
+        run_start = datetime.combine(
+            self.model_run.run_date,
+            time(hour=self.model_run.cycle_hour)
+        ).replace(tzinfo=timezone.utc)
+        return (
+            int((self.start - run_start).total_seconds() // 3600),
+            int((self.end - run_start).total_seconds() // 3600)
+        )
+
+
+def describe_segments(segments: List[ForecastSegment], run_label: Callable[[ModelRun], str]) -> str:
+    """Describe forecast provenance, e.g. `20250218 06z f000-f048 + 20250218 00z f054-f120`.
+
+    A forecast from a single run is described by the run label alone.
+    """
+    if len(segments) == 1:
+        return run_label(segments[0].model_run)
+    parts = []
+    for segment in segments:
+        first_hour, last_hour = segment.forecast_hours
+        parts.append(f"{run_label(segment.model_run)} f{first_hour:03d}-f{last_hour:03d}")
+    return " + ".join(parts)
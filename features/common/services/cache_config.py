@@ -1,54 +1,158 @@
-from typing import Optional, Any, Callable
-from aiocache import SimpleMemoryCache, caches
-from aiocache.serializers import PickleSerializer
+import logging
+import pickle
+import zlib
+from typing import Optional, Any, Awaitable, Callable, Dict
+from urllib.parse import urlparse
+from aiocache import BaseCache, caches
+from aiocache.serializers import BaseSerializer
+
+from core.config import settings
+from features.common.model_run import ModelRun
+from features.common.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
 
 # Cache expiration times (in seconds)
 MODEL_FORECAST_EXPIRE = 14400  # 4 hours - matches GFS model run frequency
 CURRENT_CONDITIONS_EXPIRE = 900  # 15 minutes - real-time data
 STATIC_DATA_EXPIRE = None  # No expiration for static data
+# 1 day - run-versioned entries are replaced when the run changes, this only bounds orphans
+MODEL_RUN_FORECAST_EXPIRE = 86400
+# 12 hours - tide predictions are fixed for the days they cover
+TIDE_PREDICTIONS_EXPIRE = 43200
+# 1 hour - observations are republished every poll, this drops them if polling stops
+OBSERVATIONS_EXPIRE = 3600
 
-# Configure default cache
-caches.set_config({
-    'default': {
-        'cache': "aiocache.SimpleMemoryCache",
+class CompressedPickleSerializer(BaseSerializer):
+    """Pickle values and zlib-compress them, keeping responses compact in a shared cache."""
+    
+    DEFAULT_ENCODING = None  # Values are stored as bytes
+    
+    def dumps(self, value: Any) -> bytes:
+        return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        
+    def loads(self, value: Optional[bytes]) -> Any:
+        if value is None:
+            return None
+        return pickle.loads(zlib.decompress(value))
+
+def build_cache_config(backend: str) -> Dict[str, Any]:
+    """Build the aiocache config of a backend named in settings.cache.
+    
+    "memory" keeps entries in this process. "redis" shares them between all
+    workers through settings.redis_url, and "fakeredis" runs the Redis code path
+    against an in-process server for local runs.
+    """
+    if backend == "memory":
+        return {
+            'cache': "aiocache.SimpleMemoryCache",
+            'serializer': {
+                'class': "aiocache.serializers.PickleSerializer"
+            },
+            'ttl': MODEL_FORECAST_EXPIRE,
+        }
+        
+    if backend not in ("redis", "fakeredis"):
+        raise ValueError(f"Unknown cache backend {backend}")
+        
+    redis_url = urlparse(settings.redis_url)
+    config = {
+        'cache': "aiocache.RedisCache",
+        'endpoint': redis_url.hostname or "localhost",
+        'port': redis_url.port or 6379,
+        'db': int(redis_url.path.lstrip("/") or 0),
+        'password': redis_url.password,
+        'namespace': settings.cache["prefix"],
         'serializer': {
-            'class': "aiocache.serializers.PickleSerializer"
+            'class': "features.common.services.cache_config.CompressedPickleSerializer"
         },
         'ttl': MODEL_FORECAST_EXPIRE,
     }
+    if backend == "fakeredis":
+        # Connections to the same endpoint share one in-process server
+        from fakeredis.aioredis import FakeConnection
+        config['connection_pool_kwargs'] = {"connection_class": FakeConnection}
+    return config
+
+# Configure default cache
+caches.set_config({
+    'default': build_cache_config(settings.cache["backend"])
 })
 
-def get_cache() -> SimpleMemoryCache:
+def get_cache() -> BaseCache:
     """Get the default cache instance."""
     return caches.get('default')  # type: ignore
 
-def feature_cache_key_builder(
-    func: Callable,
-    namespace: Optional[str] = None,
-    *args: Any, 
-    **kwargs: Any,
-) -> str:
-    """Standard cache key builder for station-specific endpoints.
+# Model run whose cache generation the ingesting worker last primed
+PUBLISHED_MODEL_RUN_KEY = "model_run:published"
+
+async def publish_model_run(model_run: ModelRun) -> None:
+    """Point every worker at a model run's cache generation."""
+    try:
+        await get_cache().set(PUBLISHED_MODEL_RUN_KEY, model_run, ttl=STATIC_DATA_EXPIRE)
+    except Exception as e:
+        logger.error(f"❌ Error publishing model run {model_run}: {str(e)}")
+
+async def get_published_model_run() -> Optional[ModelRun]:
+    """Get the model run whose cache generation workers should read, if one was published."""
+    try:
+        return await get_cache().get(PUBLISHED_MODEL_RUN_KEY)
+    except Exception as e:
+        logger.error(f"❌ Error reading the published model run: {str(e)}")
+        return None
+
+def model_run_cache_id(model_run: ModelRun) -> str:
+    """Identify a model run in cache keys, e.g. `20250218_06z`."""
+    return f"{model_run.date_str}_{model_run.cycle_hour:02d}z"
+
+class ModelRunCache:
+    """Station forecast cache versioned by model run.
     
-    Args:
-        func: The function being cached
-        namespace: Optional namespace for the cache key
-        args: Positional arguments passed to the function
-        kwargs: Keyword arguments passed to the function
-        
-    Returns:
-        str: Cache key in format {namespace}:{station_id}
+    Keys have the form `{namespace}:{run_id}:station:{station_id}`. Reads use the
+    current run's generation, so switching runs is a single generation bump.
+    Entries of the previous run are evicted lazily as each station is rewritten
+    for the new one, with the TTL as a backstop for stations never requested again.
+    Concurrent builds of the same station and run are coalesced into one.
     """
-    # Get station_id from args if not in kwargs
-    station_id = kwargs.get("station_id")
-    if not station_id and args:
-        station_id = args[0]  # First arg is station_id
     
-    if not station_id:
-        raise ValueError("station_id is required for caching")
+    def __init__(self, namespace: str, ttl: Optional[int] = MODEL_RUN_FORECAST_EXPIRE):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.run_id: Optional[str] = None
+        self._previous_run_id: Optional[str] = None
+        self._cache = get_cache()
+        self._in_flight = SingleFlight()
+        
+    def key(self, station_id: str, run_id: Optional[str] = None) -> str:
+        """Build a station's key in a run's generation, the current one by default."""
+        return f"{self.namespace}:{run_id or self.run_id}:station:{station_id}"
+        
+    def set_run(self, run_id: str) -> None:
+        """Serve reads from a run's generation."""
+        if run_id != self.run_id:
+            self._previous_run_id, self.run_id = self.run_id, run_id
+            
+    async def get(self, station_id: str) -> Any:
+        """Get a station's entry from the current generation."""
+        if not self.run_id:
+            return None
+        return await self._cache.get(self.key(station_id))
         
-    if not namespace:
-        namespace = func.__name__
+    async def set(self, station_id: str, value: Any, run_id: str) -> None:
+        """Store a station's entry in a run's generation, evicting it from the previous run."""
+        await self._cache.set(self.key(station_id, run_id), value, ttl=self.ttl)
+        if self._previous_run_id and self._previous_run_id != run_id:
+            await self._cache.delete(self.key(station_id, self._previous_run_id))
+            
+    async def build(self, station_id: str, run_id: str, build: Callable[[], Awaitable[Any]]) -> Any:
+        """Build and store a station's entry in a run's generation.
         
-    # Ensure unique key per station
-    return f"{namespace}:station:{station_id}" 
\ No newline at end of file
+        Callers arriving while the same entry is being built await that build
+        instead of starting their own.
+        """
+        async def build_and_set() -> Any:
+            value = await build()
+            await self.set(station_id, value, run_id)
+            return value
+            
+        return await self._in_flight.do(self.key(station_id, run_id), build_and_set)
@@ -0,0 +1,36 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+def get_decode_executor() -> ProcessPoolExecutor:
+    """Get the shared process pool for GRIB decoding, starting it on first use."""
+    global _executor
+    if _executor is None:
+        # Spawned workers don't inherit the event loop's threads or open sockets
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.decode_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.info(f"⚙️ Started GRIB decode pool with {settings.decode_workers} workers")
+    return _executor
+
+async def run_in_decode_pool(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a module-level function in the decode pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_decode_executor(), partial(func, *args, **kwargs))
+
+def shutdown_decode_pool() -> None:
+    """Stop the decode pool's worker processes."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
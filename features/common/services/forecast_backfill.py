@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, List, Optional, Protocol
+
+from core.config import settings
+from features.common.model_run import ModelRun
+
+logger = logging.getLogger(__name__)
+
+class BackfillClient(Protocol):
+    """Forecast client whose run is loaded progressively, as its hours are published."""
+    model_run: Optional[ModelRun]
+    previous_client: Optional[Any]
+
+    def get_expected_time(self, forecast_hour: int) -> datetime: ...
+
+    def get_pending_hours(self) -> List[int]: ...
+
+    async def backfill(self, forecast_hours: List[int]) -> int: ...
+
+async def run_forecast_backfill(
+    client: BackfillClient,
+    name: str,
+    on_update: Callable[[], Awaitable[Any]]
+) -> bool:
+    """Load a client's missing forecast hours as they become due until all are loaded or the window closes.
+    
+    Hours already due are attempted straight away, overdue ones are then retried
+    every `backfill_retry_minutes`. The previous run stops being stitched in only once
+    the run is complete. `on_update` is awaited after new hours are merged, e.g.
+    to re-prime caches. Returns whether the run was completed.
+    """
+    model_run = client.model_run
+    if not model_run:
+        return False
+        
+    retry_interval = timedelta(minutes=settings.wind.backfill_retry_minutes)
+    deadline = model_run.available_time + timedelta(hours=settings.wind.backfill_window_hours)
+    
+    while client.model_run is model_run:
+        # Hours already overdue when the run is switched in are attempted straight away
+        now = datetime.now(timezone.utc)
+        due_hours = [hour for hour in client.get_pending_hours() if client.get_expected_time(hour) <= now]
+        if due_hours and await client.backfill(due_hours) > 0:
+            await on_update()
+            
+        if client.model_run is not model_run:
+            return False
+            
+        pending = client.get_pending_hours()
+        if not pending:
+            client.previous_client = None
+            logger.info(f"✅ All {name} forecast hours loaded for {model_run}, backfill complete")
+            return True
+            
+        now = datetime.now(timezone.utc)
+        if now >= deadline:
+            logger.warning(f"⚠️ Giving up on {len(pending)} {name} forecast hours for {model_run}")
+            return False
+            
+        # Sleep until the next hour is due, or retry overdue hours after an interval
+        next_expected = min(client.get_expected_time(hour) for hour in pending)
+        wait = next_expected - now if next_expected > now else retry_interval
+        logger.info(
+            f"⏳ {len(pending)} {name} forecast hours pending, "
+            f"next backfill in {wait.total_seconds() / 60:.1f} minutes"
+        )
+        await asyncio.sleep(min(wait, deadline - now).total_seconds())
+        
+    return False
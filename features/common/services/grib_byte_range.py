@@ -0,0 +1,105 @@
+import logging
+import aiohttp
+from typing import AsyncIterator, List, Optional, Tuple
+from pydantic import BaseModel
+
+from features.common.services.rate_limiter import nomads_rate_limiter
+from features.common.utils.atomic_file import DOWNLOAD_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+class GribIndexEntry(BaseModel):
+    """Single message from a NOMADS .idx inventory."""
+    number: int
+    offset: int
+    variable: str
+    level: str
+
+def parse_grib_index(text: str) -> List[GribIndexEntry]:
+    """Parse a .idx inventory, e.g. `1:0:d=2025021806:HTSGW:surface:anl:`."""
+    entries = []
+    for line in text.splitlines():
+        parts = line.strip().split(":")
+        if len(parts) < 5:
+            continue
+        try:
+            entries.append(GribIndexEntry(
+                number=int(parts[0].split(".")[0]),
+                offset=int(parts[1]),
+                variable=parts[3],
+                level=parts[4]
+            ))
+        except ValueError:
+            continue
+    return entries
+
+def select_byte_ranges(
+    entries: List[GribIndexEntry],
+    messages: List[Tuple[str, str]]
+) -> List[Tuple[int, Optional[int]]]:
+    """Get merged (start, end) byte ranges for the wanted (variable, level) messages.
+
+    The end of the last message in a file is unknown, so its range is open (None).
+    """
+    wanted = set(messages)
+    ranges: List[Tuple[int, Optional[int]]] = []
+
+    for i, entry in enumerate(entries):
+        if (entry.variable, entry.level) not in wanted:
+            continue
+        end = entries[i + 1].offset - 1 if i + 1 < len(entries) else None
+
+        # Merge with the previous range when the messages are adjacent
+        if ranges and ranges[-1][1] is not None and ranges[-1][1] + 1 == entry.offset:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((entry.offset, end))
+
+    return ranges
+
+async def _fetch(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+    """Fetch a small file within the shared NOMADS budget."""
+    await nomads_rate_limiter.acquire()
+    async with session.get(url) as response:
+        if response.status != 200:
+            logger.error(f"Download failed with status {response.status}: {url}")
+            return None
+        return await response.read()
+
+async def get_byte_ranges(
+    session: aiohttp.ClientSession,
+    url: str,
+    messages: List[Tuple[str, str]]
+) -> List[Tuple[int, Optional[int]]]:
+    """Get the merged byte ranges of the wanted messages from a file's .idx inventory."""
+    index_content = await _fetch(session, f"{url}.idx")
+    if not index_content:
+        return []
+
+    ranges = select_byte_ranges(parse_grib_index(index_content.decode()), messages)
+    if not ranges:
+        logger.error(f"No messages matching {messages} in {url}.idx")
+    return ranges
+
+async def stream_byte_ranges(
+    session: aiohttp.ClientSession,
+    url: str,
+    ranges: List[Tuple[int, Optional[int]]]
+) -> AsyncIterator[bytes]:
+    """Stream the given byte ranges of a GRIB file in order.
+
+    GRIB messages are self-contained, so the ranges can simply be concatenated.
+    A server that ignores Range answers 200 with the whole file, which would be
+    written once per range, so anything but 206 Partial Content fails the download.
+    """
+    for start, end in ranges:
+        await nomads_rate_limiter.acquire()
+        byte_range = f"bytes={start}-{end if end is not None else ''}"
+        async with session.get(url, headers={"Range": byte_range}) as response:
+            if response.status != 206:
+                raise ValueError(
+                    f"Byte-range download failed with status {response.status} "
+                    f"(expected 206 Partial Content)"
+                )
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                yield chunk
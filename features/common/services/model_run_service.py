@@ -1,8 +1,11 @@
+import asyncio
 import logging
 from datetime import datetime, date, timedelta, timezone
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from email.utils import parsedate_to_datetime
 from features.common.model_run import ModelRun
+from features.common.services.rate_limiter import nomads_rate_limiter
+from core.config import settings
 
 import aiohttp
 
@@ -11,6 +14,19 @@ logger = logging.getLogger(__name__)
 class ModelRunService:
     """Service to check for available GFS model runs."""
     
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+    async def _init_session(self) -> aiohttp.ClientSession:
+        if not self._session:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return self._session
+        
+    async def close(self):
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
     def _log_model_run_info(self, model_run: ModelRun, check_date: date, cycle: int):
         """Log model run information with both UTC and EST times."""
         logger.info(f"📊 Model Run: {model_run.date_str} {cycle:02d}Z")
@@ -37,66 +53,114 @@ class ModelRunService:
         url = f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/gfs/prod/gfs.{date_str}/{cycle_str}/wave/gridded/gfswave.t{cycle_str}z.atlocn.0p16.f000.grib2"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.head(url, timeout=30) as response:
-                    if response.status != 200:
-                        return None
-                        
-                    content_length = response.headers.get("Content-Length")
-                    if content_length and int(content_length) < min_size:
-                        return None
-                        
-                    last_modified = response.headers.get("Last-Modified")
-                    if not last_modified:
-                        return None
-                        
-                    # parsedate_to_datetime returns UTC time
-                    available_time = parsedate_to_datetime(last_modified)
-                    model_run = ModelRun(
-                        run_date=target_date,
-                        cycle_hour=cycle_hour,
-                        available_time=available_time
-                    )
-                    return model_run
+            session = await self._init_session()
+            await nomads_rate_limiter.acquire()
+            async with session.head(url) as response:
+                if response.status != 200:
+                    return None
+                    
+                content_length = response.headers.get("Content-Length")
+                if content_length and int(content_length) < min_size:
+                    return None
+                    
+                last_modified = response.headers.get("Last-Modified")
+                if not last_modified:
+                    return None
+                    
+                # parsedate_to_datetime returns UTC time
+                available_time = parsedate_to_datetime(last_modified)
+                model_run = ModelRun(
+                    run_date=target_date,
+                    cycle_hour=cycle_hour,
+                    available_time=available_time
+                )
+                return model_run
                     
         except Exception as e:
             logger.error(f"Error checking cycle {cycle_str}Z: {e}")
             return None
 
-    async def get_latest_available_cycle(self) -> Optional[ModelRun]:
-        """Get the latest available model cycle."""
-        # Get current time in both UTC and EST
-        utc_now, est_now = ModelRun.get_current_time()
-        
-        target_date = utc_now.date()
+    def _get_candidate_cycles(
+        self,
+        utc_now: datetime,
+        newer_than: Optional[ModelRun] = None
+    ) -> List[Tuple[date, int]]:
+        """Get today's and yesterday's cycles that may be published by now, newest first."""
+        lead = timedelta(seconds=settings.model_run_polling["lead_seconds"])
+        candidates = []
         
         # Check today and yesterday only - no need to go back further
         for delta in [0, -1]:
-            check_date = target_date + timedelta(days=delta)
-            check_previous = delta < 0
-            
-            # Get available cycles based on current hour
-            available_cycles = ModelRun.get_available_cycles(utc_now.hour, check_previous)
-            logger.debug(f"Checking date {check_date} for cycles: {available_cycles}")
-            
-            for cycle in sorted(available_cycles, reverse=True):
-                model_run = await self.check_grib_file_for_cycle(check_date, cycle)
-                if model_run:
-                    # Only log model run info during startup or when a new run is detected
-                    if not hasattr(self, '_last_model_run') or (
-                        self._last_model_run.run_date != model_run.run_date or 
-                        self._last_model_run.cycle_hour != model_run.cycle_hour
-                    ):
-                        self._log_model_run_info(model_run, check_date, cycle)
-                        self._last_model_run = model_run
-                    return model_run
+            check_date = utc_now.date() + timedelta(days=delta)
+            for cycle in sorted(ModelRun.VALID_CYCLES, reverse=True):
+                candidate = ModelRun(run_date=check_date, cycle_hour=cycle, available_time=utc_now)
+                if candidate.expected_available_time - lead > utc_now:
+                    continue
+                if newer_than and not candidate.is_newer_than(newer_than):
+                    continue
+                candidates.append((check_date, cycle))
+        return candidates
+
+    async def get_latest_available_cycle(
+        self,
+        newer_than: Optional[ModelRun] = None
+    ) -> Optional[ModelRun]:
+        """Get the latest available model cycle, optionally only one newer than a known run.
+        
+        Candidate cycles are probed concurrently and the newest published one wins.
+        """
+        utc_now, _ = ModelRun.get_current_time()
+        candidates = self._get_candidate_cycles(utc_now, newer_than)
+        logger.debug(f"Checking cycles: {[f'{d} {c:02d}Z' for d, c in candidates]}")
+        
+        results = await asyncio.gather(*[
+            self.check_grib_file_for_cycle(check_date, cycle) for check_date, cycle in candidates
+        ])
+        for (check_date, cycle), model_run in zip(candidates, results):
+            if model_run:
+                # Only log model run info during startup or when a new run is detected
+                if not hasattr(self, '_last_model_run') or (
+                    self._last_model_run.run_date != model_run.run_date or 
+                    self._last_model_run.cycle_hour != model_run.cycle_hour
+                ):
+                    self._log_model_run_info(model_run, check_date, cycle)
+                    self._last_model_run = model_run
+                return model_run
+        
+        if newer_than:
+            return None
         
         # If we get here, use yesterday's last successful cycle
-        yesterday = target_date - timedelta(days=1)
+        yesterday = utc_now.date() - timedelta(days=1)
         last_cycle = 18  # Default to last cycle of the day
         logger.warning("⚠️  No recent cycles found, falling back to yesterday's 18Z cycle")
         return ModelRun(
             run_date=yesterday,
             cycle_hour=last_cycle,
             available_time=datetime.now(timezone.utc)
-        ) 
\ No newline at end of file
+        )
+
+    async def wait_for_new_run(self, current_run: ModelRun) -> ModelRun:
+        """Wait until a model run newer than the current one is published.
+        
+        Sleeps until shortly before the next cycle's expected publication, then
+        polls with backoff so the run is picked up soon after it appears.
+        """
+        config = settings.model_run_polling
+        expected = current_run.next_expected_available_time
+        wake_time = expected - timedelta(seconds=config["lead_seconds"])
+        delay = (wake_time - datetime.now(timezone.utc)).total_seconds()
+        if delay > 0:
+            logger.info(
+                f"💤 Next model run expected at {expected.strftime('%Y-%m-%d %H:%M')} UTC, "
+                f"checking again in {delay / 60:.0f} minutes"
+            )
+            await asyncio.sleep(delay)
+        
+        interval = config["initial_interval_seconds"]
+        while True:
+            model_run = await self.get_latest_available_cycle(newer_than=current_run)
+            if model_run:
+                return model_run
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, config["max_interval_seconds"])
@@ -0,0 +1,36 @@
+import asyncio
+import time
+
+from core.config import settings
+
+class TokenBucket:
+    """Async token bucket enforcing a request budget across concurrent callers."""
+
+    def __init__(self, requests_per_minute: int, burst: int):
+        self.rate = requests_per_minute / 60  # Tokens added per second
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        # Waiters queue on the lock so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+# Shared by every client that downloads from NOMADS
+nomads_rate_limiter = TokenBucket(
+    requests_per_minute=settings.nomads_rate_limit["requests_per_minute"],
+    burst=settings.nomads_rate_limit["burst"]
+)
@@ -0,0 +1,42 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator
+
+# Bytes read from the network per chunk when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+def get_partial_path(file_path: Path) -> Path:
+    """Get the temp path a file is streamed to before it is renamed into place."""
+    return file_path.with_name(f"{file_path.name}.part")
+
+async def write_stream_atomic(
+    file_path: Path,
+    chunks: AsyncIterator[bytes],
+    min_size: int = 0
+) -> int:
+    """Stream chunks to a temp file from a worker thread, then atomically rename it.
+
+    Raises ValueError when fewer than `min_size` bytes arrive. A failed or
+    interrupted write never leaves a file at `file_path`.
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = get_partial_path(file_path)
+    size = 0
+
+    f = await asyncio.to_thread(open, tmp_path, "wb")
+    try:
+        async for chunk in chunks:
+            await asyncio.to_thread(f.write, chunk)
+            size += len(chunk)
+        await asyncio.to_thread(f.close)
+
+        if size < min_size:
+            raise ValueError(f"Downloaded file too small ({size} bytes), likely error page")
+
+        os.replace(tmp_path, file_path)
+        return size
+    except BaseException:
+        f.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
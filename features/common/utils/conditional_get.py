@@ -0,0 +1,69 @@
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+import aiohttp
+from yarl import URL
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+@dataclass
+class _ValidatedResult(Generic[T]):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    result: T
+
+class ConditionalGet:
+    """GETs that revalidate with each URL's last ETag / Last-Modified.
+
+    The validators of a full response are sent back as If-None-Match and
+    If-Modified-Since on the next fetch of the same URL. A 304 reuses the
+    result parsed from the last full response, without downloading or
+    parsing it again. Only the `max_entries` most recently fetched URLs are
+    remembered.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, _ValidatedResult]" = OrderedDict()
+
+    async def get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        parse: Callable[[str], T],
+        **kwargs: Any
+    ) -> T:
+        """Fetch a URL and parse its body, or reuse the last parse if it's unchanged."""
+        # Query parameters are part of the resource, so they're part of the key
+        params = kwargs.get("params")
+        key = str(URL(url).update_query(params)) if params else url
+        cached = self._results.get(key)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        async with session.get(url, headers=headers, **kwargs) as response:
+            if response.status == 304 and cached is not None:
+                self._results.move_to_end(key)
+                return cached.result
+            response.raise_for_status()
+            text = await response.text()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        result = parse(text)
+        if etag or last_modified:
+            self._results[key] = _ValidatedResult(etag, last_modified, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        else:
+            self._results.pop(key, None)
+        return result
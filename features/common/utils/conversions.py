@@ -3,6 +3,8 @@ from typing import Optional
 class UnitConversions:
     """Centralized utility for unit conversions across the application."""
     
+    MS_TO_MPH = 2.23694  # 1 m/s = 2.23694 mph
+    
     @staticmethod
     def meters_to_feet(meters: Optional[float]) -> Optional[float]:
         """Convert meters to feet."""
@@ -15,4 +17,4 @@ class UnitConversions:
         """Convert meters per second to miles per hour."""
         if ms is None:
             return None
-        return round(ms * 2.23694, 2)  # 1 m/s = 2.23694 mph 
\ No newline at end of file
+        return round(ms * UnitConversions.MS_TO_MPH, 2) 
\ No newline at end of file
@@ -0,0 +1,181 @@
+import numpy as np
+import xarray as xr
+from typing import Dict, List, Optional, Tuple
+
+from features.common.utils.grid_index import StationGridIndex
+
+# Fixed-point (scale, offset) encodings of compact grids, stored as uint16
+QUANTIZATION: Dict[str, Tuple[float, float]] = {
+    "swh": (0.001, 0.0),        # Wave height, 1 mm steps up to 65 m
+    "perpw": (0.01, 0.0),       # Wave period, 0.01 s steps
+    "dirpw": (0.1, 0.0),        # Wave direction, tenths of a degree
+    "speed_mph": (0.01, 0.0),   # Wind speed, 0.01 mph steps
+    "direction": (0.1, 0.0),    # Wind direction, tenths of a degree
+    "gust": (0.01, 0.0),        # Gust, 0.01 m/s steps
+}
+# Angular variables wrap, so 359.96 degrees encodes as 0.0 rather than 360.0. Only
+# values within one period of the range wrap, others (e.g. 1e9) are out of range
+QUANTIZATION_PERIOD: Dict[str, float] = {"dirpw": 360.0, "direction": 360.0}
+QUANTIZED_FILL = np.iinfo(np.uint16).max  # Marks missing values
+
+def quantize(
+    values: np.ndarray,
+    scale: float,
+    offset: float,
+    period: Optional[float] = None
+) -> np.ndarray:
+    """Encode values as uint16 fixed point, with missing or out-of-range values as fill."""
+    steps = np.rint((values - offset) / scale)
+    valid = np.isfinite(steps)
+    if period is not None:
+        period_steps = round(period / scale)
+        valid &= (steps >= -period_steps) & (steps < 2 * period_steps)
+        steps = np.mod(steps, period_steps)
+    valid &= (steps >= 0) & (steps < QUANTIZED_FILL)
+    return np.where(valid, steps, QUANTIZED_FILL).astype(np.uint16)
+
+def dequantize(values: np.ndarray, scales: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Decode uint16 fixed point along the last (variable) axis, restoring fill as NaN."""
+    decoded = values.astype(np.float32) * scales.astype(np.float32) + offsets.astype(np.float32)
+    decoded[values == QUANTIZED_FILL] = np.nan
+    return decoded
+
+class StationSeriesTable:
+    """Compact (station, time, variable) forecast series for every indexed station."""
+
+    def __init__(
+        self,
+        station_ids: List[str],
+        times: np.ndarray,
+        variables: List[str],
+        values: np.ndarray,
+        scales: Optional[np.ndarray] = None,
+        offsets: Optional[np.ndarray] = None
+    ):
+        self.station_ids = station_ids
+        self.times = times
+        self.variables = variables
+        self.values = values
+        # Per-variable encoding when values are compact uint16
+        self.scales = scales
+        self.offsets = offsets
+        self._positions: Dict[str, int] = {station_id: i for i, station_id in enumerate(station_ids)}
+        self._variable_positions = {name: i for i, name in enumerate(variables)}
+
+    def variable_index(self, name: str) -> int:
+        """Get the position of a variable on the last axis."""
+        return self._variable_positions[name]
+
+    def series(self, station_id: str) -> Optional[np.ndarray]:
+        """Get the (time, variable) series for a station, decoded to float32."""
+        position = self._positions.get(station_id)
+        if position is None:
+            return None
+        if self.scales is not None:
+            return dequantize(self.values[position], self.scales, self.offsets)
+        return self.values[position]
+
+class ForecastGrid:
+    """Resident (time, lat, lon, variable) forecast cube for one region of a model run.
+
+    Values are float32, or uint16 fixed point per QUANTIZATION when the grid is compact.
+    """
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        variables: List[str],
+        values: np.ndarray,
+        scales: Optional[np.ndarray] = None,
+        offsets: Optional[np.ndarray] = None
+    ):
+        self.times = times
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.variables = variables
+        self.values = values
+        self.scales = scales
+        self.offsets = offsets
+        self._variable_positions = {name: i for i, name in enumerate(variables)}
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset: xr.Dataset,
+        variables: List[str],
+        compact: bool = False
+    ) -> "ForecastGrid":
+        """Load variables of a (time, latitude, longitude) dataset into a single cube.
+
+        With `compact`, values are quantized to uint16 one variable at a time, so the
+        float cube is never held in full.
+        """
+        dataset = dataset.transpose("time", "latitude", "longitude")
+        if not compact:
+            values = np.stack(
+                [dataset[name].values.astype(np.float32) for name in variables],
+                axis=-1
+            )
+            scales = offsets = None
+        else:
+            values = np.empty(dataset[variables[0]].shape + (len(variables),), dtype=np.uint16)
+            for i, name in enumerate(variables):
+                values[..., i] = quantize(
+                    dataset[name].values,
+                    *QUANTIZATION[name],
+                    period=QUANTIZATION_PERIOD.get(name)
+                )
+            scales = np.array([QUANTIZATION[name][0] for name in variables])
+            offsets = np.array([QUANTIZATION[name][1] for name in variables])
+
+        return cls(
+            times=dataset.time.values,
+            latitudes=dataset.latitude.values,
+            longitudes=dataset.longitude.values,
+            variables=list(variables),
+            values=values,
+            scales=scales,
+            offsets=offsets
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the cube values."""
+        return self.values.nbytes
+
+    def variable_index(self, name: str) -> int:
+        """Get the position of a variable on the last axis."""
+        return self._variable_positions[name]
+
+    def merge(self, other: "ForecastGrid") -> "ForecastGrid":
+        """Combine with a cube of further forecast hours on the same grid, ordered by time."""
+        if (
+            other.variables != self.variables
+            or other.values.shape[1:] != self.values.shape[1:]
+            or other.values.dtype != self.values.dtype
+        ):
+            raise ValueError("Cannot merge forecast grids with different grids, variables or encodings")
+        times, first = np.unique(np.concatenate([self.times, other.times]), return_index=True)
+        return ForecastGrid(
+            times=times,
+            latitudes=self.latitudes,
+            longitudes=self.longitudes,
+            variables=list(self.variables),
+            values=np.concatenate([self.values, other.values])[first],
+            scales=self.scales,
+            offsets=self.offsets
+        )
+
+    def extract_stations(self, index: StationGridIndex) -> StationSeriesTable:
+        """Pull every indexed station's series in one fancy-indexing pass."""
+        values = self.values[:, index.lat_idx, index.lon_idx, :]  # (time, station, variable)
+        return StationSeriesTable(
+            station_ids=list(index.station_ids),
+            times=self.times,
+            variables=list(self.variables),
+            values=np.ascontiguousarray(values.transpose(1, 0, 2)),
+            scales=self.scales,
+            offsets=self.offsets
+        )
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+R = TypeVar("R", bound=BaseModel)
+
+def get_window_start(now: datetime) -> datetime:
+    """Round `now` down to the 3-hour step that served forecasts start from."""
+    now = now.replace(minute=0, second=0, microsecond=0)
+    return now.replace(hour=(now.hour // 3) * 3)
+
+def trim_to_window(response: R) -> R:
+    """Drop the points of a forecast response built earlier that are now in the past.
+
+    Responses are cached for the life of their model run, so their window
+    has to be moved up to the current time when they are served.
+    """
+    start = get_window_start(datetime.now(timezone.utc))
+    forecasts = [
+        point for point in response.forecasts
+        if point.time.replace(minute=0, second=0, microsecond=0) >= start
+    ]
+    if len(forecasts) == len(response.forecasts):
+        return response
+    return response.model_copy(update={"forecasts": forecasts})
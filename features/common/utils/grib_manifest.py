@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+GRIB_START = b"GRIB"
+GRIB_END = b"7777"
+
+class GribFileRecord(BaseModel):
+    """Integrity details of a fully downloaded GRIB file."""
+    size: int
+    message_count: int
+    end_markers: int
+    sha256: str
+
+class GribStreamInspector:
+    """Walk GRIB message headers and end markers as a file streams past.
+
+    Only the few bytes around message boundaries are buffered, so inspecting
+    a download costs no more memory than streaming it.
+    """
+
+    def __init__(self):
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+        self.message_count = 0
+        self.end_markers = 0
+        self.error: Optional[str] = None
+        self._buffer = bytearray()
+        self._buffer_start = 0  # File offset of the first buffered byte
+        self._next_message = 0  # File offset of the next message header
+        self._pending_marker: Optional[int] = None  # File offset of an unchecked end marker
+
+    def update(self, chunk: bytes) -> None:
+        """Feed the next chunk of the file."""
+        self._sha256.update(chunk)
+        self.size += len(chunk)
+        if self.error:
+            return
+        self._buffer += chunk
+        self._scan()
+
+    def _read(self, offset: int, length: int) -> Optional[bytes]:
+        """Get buffered bytes at a file offset, or None until they have arrived."""
+        start = offset - self._buffer_start
+        if len(self._buffer) < start + length:
+            return None
+        return bytes(self._buffer[start:start + length])
+
+    def _scan(self) -> None:
+        """Check every message boundary that has fully arrived."""
+        while not self.error:
+            if self._pending_marker is not None:
+                marker = self._read(self._pending_marker, 4)
+                if marker is None:
+                    break
+                if marker != GRIB_END:
+                    self.error = f"Missing end marker at byte {self._pending_marker}"
+                    break
+                self.end_markers += 1
+                self._pending_marker = None
+
+            header = self._read(self._next_message, 16)
+            if header is None:
+                break
+            if header[:4] != GRIB_START:
+                self.error = f"Missing GRIB header at byte {self._next_message}"
+                break
+
+            edition = header[7]
+            if edition == 2:
+                length = int.from_bytes(header[8:16], "big")
+            elif edition == 1:
+                length = int.from_bytes(header[4:7], "big")
+            else:
+                self.error = f"Unsupported GRIB edition {edition}"
+                break
+
+            self.message_count += 1
+            self._pending_marker = self._next_message + length - 4
+            self._next_message += length
+
+        # Drop bytes before the next boundary that still has to be checked
+        needed = self._pending_marker if self._pending_marker is not None else self._next_message
+        drop = min(needed - self._buffer_start, len(self._buffer))
+        del self._buffer[:drop]
+        self._buffer_start += drop
+
+    def finish(self) -> GribFileRecord:
+        """Get the file's record, raising ValueError if it is not complete GRIB."""
+        if not self.error:
+            if self.message_count == 0:
+                self.error = "No GRIB messages found"
+            elif self._pending_marker is not None or self._next_message != self.size:
+                self.error = f"Truncated GRIB file ({self.size} bytes, expected {self._next_message})"
+        if self.error:
+            raise ValueError(self.error)
+
+        return GribFileRecord(
+            size=self.size,
+            message_count=self.message_count,
+            end_markers=self.end_markers,
+            sha256=self._sha256.hexdigest()
+        )
+
+async def inspect_grib_stream(
+    chunks: AsyncIterator[bytes],
+    inspector: GribStreamInspector
+) -> AsyncIterator[bytes]:
+    """Pass chunks through the inspector, failing the stream if the file is not complete."""
+    async for chunk in chunks:
+        inspector.update(chunk)
+        yield chunk
+    inspector.finish()
+
+class GribManifest:
+    """JSON record of the verified GRIB files of one model run, keyed by file name."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._records: Dict[str, GribFileRecord] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load existing records, starting empty when the manifest is missing or corrupt."""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            self._records = {
+                name: GribFileRecord(**record) for name, record in data.get("files", {}).items()
+            }
+        except Exception as e:
+            logger.error(f"Error reading manifest {self.path}: {str(e)}")
+            self._records = {}
+
+    def _save(self) -> None:
+        """Write the manifest, replacing the previous one atomically."""
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps({
+            "files": {name: record.model_dump() for name, record in self._records.items()}
+        }))
+        os.replace(tmp_path, self.path)
+
+    def get(self, file_name: str) -> Optional[GribFileRecord]:
+        """Get the record of a verified file."""
+        return self._records.get(file_name)
+
+    def record(self, file_name: str, record: GribFileRecord) -> None:
+        """Record a verified file."""
+        self._records[file_name] = record
+        self._save()
+
+    def forget(self, file_names: List[str]) -> None:
+        """Drop files' records so they are downloaded again."""
+        for file_name in file_names:
+            self._records.pop(file_name, None)
+        self._save()
@@ -0,0 +1,223 @@
+import logging
+import shutil
+import numpy as np
+import pandas as pd
+import xarray as xr
+import zarr
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+from zarr.codecs import BloscCodec
+
+from core.config import RegionGrid
+from features.common.utils.forecast_grid import ForecastGrid
+
+logger = logging.getLogger(__name__)
+
+# Compressor for decoded forecast grids, one chunk per forecast hour
+STORE_COMPRESSOR = BloscCodec(cname="zstd", clevel=3, shuffle="bitshuffle")
+
+def crop_to_bounds(dataset: xr.Dataset, bounds: RegionGrid) -> xr.Dataset:
+    """Crop a dataset to region bounds, handling north-to-south latitudes."""
+    lats = dataset.latitude.values
+    if len(lats) > 1 and lats[0] > lats[-1]:
+        lat_slice = slice(bounds.lat.end, bounds.lat.start)
+    else:
+        lat_slice = slice(bounds.lat.start, bounds.lat.end)
+    return dataset.sel(
+        latitude=lat_slice,
+        longitude=slice(bounds.lon.start, bounds.lon.end)
+    )
+
+def decode_grib_files(file_paths: List[Path], bounds: Optional[RegionGrid] = None) -> xr.Dataset:
+    """Decode GRIB files with cfgrib and combine them along valid time.
+
+    Files fetched by byte range cover the full model grid, so they are cropped
+    to `bounds` when given.
+    """
+    datasets = []
+
+    for fp in file_paths:
+        try:
+            if not fp.exists():
+                continue
+
+            ds = xr.open_dataset(
+                fp,
+                engine="cfgrib",
+                backend_kwargs={
+                    'indexpath': '',
+                    'use_cftime': False,
+                    'decode_times': True,
+                    'decode_timedelta': False
+                }
+            )
+
+            valid_time = pd.to_datetime(ds.valid_time.values)
+            ds = ds.assign_coords(time=valid_time)
+            if bounds is not None:
+                ds = crop_to_bounds(ds, bounds)
+            datasets.append(ds)
+
+        except Exception as e:
+            logger.error(f"Error loading {fp}: {str(e)}")
+            continue
+
+    if not datasets:
+        raise Exception("No valid datasets were loaded")
+
+    return xr.concat(datasets, dim="time").sortby("time")
+
+def bounds_attr(bounds: Optional[RegionGrid]) -> Optional[List[float]]:
+    """Get the store attribute recording the box its grids were cropped to."""
+    if bounds is None:
+        return None
+    return [bounds.lat.start, bounds.lat.end, bounds.lon.start, bounds.lon.end]
+
+def _stored_bounds(attrs: dict) -> Optional[List[float]]:
+    stored = attrs.get("bounds")
+    if stored is None:
+        return None
+    return [float(value) for value in np.atleast_1d(stored)]
+
+def write_store(
+    dataset: xr.Dataset,
+    store_path: Path,
+    forecast_hours: List[int],
+    bounds: Optional[RegionGrid] = None
+) -> Path:
+    """Write a decoded dataset to a time-chunked, compressed Zarr store."""
+    tmp_path = store_path.with_name(f"{store_path.name}.tmp")
+    if tmp_path.exists():
+        shutil.rmtree(tmp_path)
+
+    dataset = dataset.assign_attrs(forecast_hours=list(forecast_hours))
+    if bounds is not None:
+        dataset = dataset.assign_attrs(bounds=bounds_attr(bounds))
+    encoding = {
+        name: {
+            "chunks": (1,) + dataset[name].shape[1:],
+            "compressors": (STORE_COMPRESSOR,),
+            "dtype": "float32"
+        }
+        for name in dataset.data_vars
+    }
+    dataset.to_zarr(tmp_path, mode="w", encoding=encoding, consolidated=True)
+
+    # Swap the finished store into place so readers never see a partial one
+    if store_path.exists():
+        shutil.rmtree(store_path)
+    tmp_path.rename(store_path)
+    return store_path
+
+def build_store_from_files(
+    file_paths: List[Path],
+    store_path: Path,
+    forecast_hours: List[int],
+    bounds: Optional[RegionGrid] = None,
+    derive: Optional[Callable[[xr.Dataset], xr.Dataset]] = None
+) -> Path:
+    """Decode GRIB files and write them to a store, for running in the decode pool.
+
+    `derive` adds computed fields to the decoded grids before they are written.
+    """
+    dataset = decode_grib_files(file_paths, bounds)
+    try:
+        if derive is not None:
+            dataset = derive(dataset)
+        return write_store(dataset, store_path, forecast_hours, bounds)
+    finally:
+        dataset.close()
+
+def append_store_from_files(
+    file_paths: List[Path],
+    store_path: Path,
+    forecast_hours: List[int],
+    variables: List[str],
+    bounds: Optional[RegionGrid] = None,
+    derive: Optional[Callable[[xr.Dataset], xr.Dataset]] = None,
+    compact: bool = False
+) -> ForecastGrid:
+    """Decode further forecast hours, append them to a store and return them as a cube.
+
+    For running in the decode pool. The store's recorded hours are updated last,
+    so an interrupted append leaves a store that is rebuilt rather than reused.
+    """
+    dataset = decode_grib_files(file_paths, bounds)
+    try:
+        if derive is not None:
+            dataset = derive(dataset)
+
+        # Appending rewrites the store attributes, so read the recorded ones first
+        group = zarr.open_group(store_path, mode="r+")
+        stored_hours = [int(hour) for hour in np.atleast_1d(group.attrs.get("forecast_hours", []))]
+        stored_bounds = _stored_bounds(group.attrs)
+        if stored_bounds != bounds_attr(bounds):
+            raise ValueError(
+                f"Store {store_path.name} was cropped to {stored_bounds}, not {bounds_attr(bounds)}"
+            )
+        dataset.to_zarr(store_path, append_dim="time", consolidated=True)
+
+        group = zarr.open_group(store_path, mode="r+")
+        group.attrs["forecast_hours"] = sorted(set(stored_hours) | set(forecast_hours))
+        if stored_bounds is not None:
+            group.attrs["bounds"] = stored_bounds
+        zarr.consolidate_metadata(store_path)
+
+        return ForecastGrid.from_dataset(dataset, variables, compact)
+    finally:
+        dataset.close()
+
+def load_forecast_grid(
+    store_path: Path,
+    variables: List[str],
+    compact: bool = False
+) -> Optional[ForecastGrid]:
+    """Read a store's variables into a resident cube, for running in the decode pool."""
+    dataset = open_store(store_path)
+    if dataset is None:
+        return None
+    try:
+        # Appended hours are stored after the original ones
+        return ForecastGrid.from_dataset(dataset.sortby("time"), variables, compact)
+    finally:
+        dataset.close()
+
+def open_store(store_path: Path) -> Optional[xr.Dataset]:
+    """Open a Zarr store lazily, returning None when it is missing or unreadable."""
+    if not store_path.exists():
+        return None
+    try:
+        return xr.open_zarr(store_path, consolidated=True)
+    except Exception as e:
+        logger.error(f"Error opening store {store_path}: {str(e)}")
+        return None
+
+def has_bounds(store_path: Path, bounds: Optional[RegionGrid]) -> bool:
+    """Check that a store's grids were cropped to `bounds`, or left uncropped for None."""
+    dataset = open_store(store_path)
+    if dataset is None:
+        return False
+    try:
+        return _stored_bounds(dataset.attrs) == bounds_attr(bounds)
+    finally:
+        dataset.close()
+
+def is_store_current(
+    store_path: Path,
+    forecast_hours: List[int],
+    variables: Sequence[str] = (),
+    bounds: Optional[RegionGrid] = None
+) -> bool:
+    """Check that a store was built from exactly these hours and bounds and holds every variable."""
+    dataset = open_store(store_path)
+    if dataset is None:
+        return False
+    try:
+        hours = [int(hour) for hour in np.atleast_1d(dataset.attrs.get("forecast_hours", []))]
+        return (
+            hours == list(forecast_hours)
+            and _stored_bounds(dataset.attrs) == bounds_attr(bounds)
+            and all(name in dataset for name in variables)
+        )
+    finally:
+        dataset.close()
@@ -0,0 +1,88 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from core.config import GridBounds, RegionGrid
+from features.common.models.station_types import Station
+
+def _regular_axis_index(axis: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Map points onto the nearest index of a regularly spaced axis."""
+    if len(axis) < 2:
+        return np.zeros(len(points), dtype=np.intp)
+    step = (axis[-1] - axis[0]) / (len(axis) - 1)
+    indexes = np.rint((points - axis[0]) / step).astype(np.intp)
+    # Clip like a nearest-neighbour lookup would for points outside the grid
+    return np.clip(indexes, 0, len(axis) - 1)
+
+def station_bounding_box(
+    stations: List[Station],
+    region: RegionGrid,
+    margin: float
+) -> Optional[RegionGrid]:
+    """Get the smallest box on a region's grid covering its stations plus a margin in degrees.
+
+    The box is snapped outward to the grid resolution and clipped to the region.
+    """
+    if not stations:
+        return None
+
+    lats = np.array([s.location.coordinates[1] for s in stations], dtype=np.float64)
+    lons = np.array([s.location.coordinates[0] for s in stations], dtype=np.float64)
+    if region.lon.end > 180:
+        lons = np.where(lons < 0, lons + 360, lons)
+
+    def snap(bounds: GridBounds, low: float, high: float) -> GridBounds:
+        step = bounds.resolution
+        return GridBounds(
+            start=max(bounds.start, np.floor((low - margin) / step) * step),
+            end=min(bounds.end, np.ceil((high + margin) / step) * step),
+            resolution=step
+        )
+
+    return RegionGrid(
+        lat=snap(region.lat, lats.min(), lats.max()),
+        lon=snap(region.lon, lons.min(), lons.max())
+    )
+
+class StationGridIndex:
+    """Precomputed station -> (lat_idx, lon_idx) table for a regular lat/lon grid."""
+
+    def __init__(self, station_ids: List[str], lat_idx: np.ndarray, lon_idx: np.ndarray):
+        self.station_ids = station_ids
+        self.lat_idx = lat_idx
+        self.lon_idx = lon_idx
+        self._positions: Dict[str, int] = {station_id: i for i, station_id in enumerate(station_ids)}
+
+    @classmethod
+    def build(
+        cls,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        stations: List[Station]
+    ) -> "StationGridIndex":
+        """Compute the grid cell of every station in one vectorized pass."""
+        station_lats = np.array([s.location.coordinates[1] for s in stations], dtype=np.float64)
+        station_lons = np.array([s.location.coordinates[0] for s in stations], dtype=np.float64)
+
+        # GRIB grids use 0-360 longitudes
+        if len(longitudes) and longitudes.max() > 180:
+            station_lons = np.where(station_lons < 0, station_lons + 360, station_lons)
+
+        return cls(
+            station_ids=[s.station_id for s in stations],
+            lat_idx=_regular_axis_index(latitudes, station_lats),
+            lon_idx=_regular_axis_index(longitudes, station_lons)
+        )
+
+    def __len__(self) -> int:
+        return len(self.station_ids)
+
+    def position(self, station_id: str) -> Optional[int]:
+        """Get the row of a station in the table."""
+        return self._positions.get(station_id)
+
+    def get(self, station_id: str) -> Optional[Tuple[int, int]]:
+        """Get the (lat_idx, lon_idx) grid cell for a station."""
+        position = self.position(station_id)
+        if position is None:
+            return None
+        return int(self.lat_idx[position]), int(self.lon_idx[position])
@@ -0,0 +1,41 @@
+import fcntl
+import logging
+from pathlib import Path
+from typing import IO, Optional
+
+logger = logging.getLogger(__name__)
+
+class IngestLock:
+    """Advisory file lock electing the one worker process that downloads model runs.
+
+    The operating system releases the lock when its holder exits, so a
+    restarted or surviving worker can take over.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file: Optional[IO] = None
+
+    @property
+    def is_held(self) -> bool:
+        return self._file is not None
+
+    def try_acquire(self) -> bool:
+        """Take the lock without waiting, returning whether this process holds it."""
+        if self._file is not None:
+            return True
+        lock_file = open(self.path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        self._file = lock_file
+        return True
+
+    def release(self) -> None:
+        """Give up the lock."""
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
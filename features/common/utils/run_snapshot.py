@@ -0,0 +1,44 @@
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+from pydantic import BaseModel
+
+from features.common.model_run import ModelRun
+
+logger = logging.getLogger(__name__)
+
+class RunSnapshotRecord(BaseModel):
+    """Last model run whose decoded stores were fully loaded."""
+    model_run: ModelRun
+    saved_at: datetime
+
+class RunSnapshot:
+    """Pointer file to the last fully loaded model run.
+
+    The run's decoded Zarr stores and GRIB manifests stay on disk under their
+    usual paths, so the pointer is all that's needed to restore the run at
+    startup without contacting NOMADS.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def load(self) -> Optional[ModelRun]:
+        """Get the snapshotted run, or None when there is no readable snapshot."""
+        if not self.path.exists():
+            return None
+        try:
+            return RunSnapshotRecord.model_validate_json(self.path.read_text()).model_run
+        except Exception as e:
+            logger.error(f"Error reading run snapshot {self.path}: {str(e)}")
+            return None
+
+    def save(self, model_run: ModelRun) -> None:
+        """Point the snapshot at a run, replacing the previous pointer atomically."""
+        record = RunSnapshotRecord(model_run=model_run, saved_at=datetime.now(timezone.utc))
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(record.model_dump_json())
+        os.replace(tmp_path, self.path)
+        logger.info(f"📸 Saved run snapshot for {model_run.date_str} {model_run.cycle_hour:02d}Z")
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from core.config import settings
+from features.common.models.station_types import Station
+from features.common.services.cache_config import OBSERVATIONS_EXPIRE, get_cache
+from features.waves.models.ndbc_types import NDBCObservation, get_data_age
+from features.waves.services.ndbc_buoy_client import NDBCBuoyClient
+
+logger = logging.getLogger(__name__)
+
+def get_next_ndbc_update(now: datetime) -> datetime:
+    """Get the next time NDBC publishes observations after `now` (at :26 and :56 by default)."""
+    hour = now.replace(minute=0, second=0, microsecond=0)
+    for hour_offset in (0, 1):
+        for minute in sorted(settings.ndbc_observation_polling["update_minutes"]):
+            update = hour + timedelta(hours=hour_offset, minutes=minute)
+            if update > now:
+                return update
+    return hour + timedelta(hours=1)
+
+def get_next_poll_time(now: datetime) -> datetime:
+    """Get the first time after `now` that is a short delay past an NDBC publish time."""
+    delay = timedelta(seconds=settings.ndbc_observation_polling["delay_seconds"])
+    return get_next_ndbc_update(now - delay) + delay
+
+class ObservationStore:
+    """Latest observation of every station, kept fresh by a background poller.
+
+    Requests read only from the store, so their latency doesn't depend on NDBC
+    and request bursts never reach it. Each poll reads the bulk latest_obs.txt
+    feed and fetches the stations missing from it individually, with bounded
+    concurrency. A station whose refresh fails keeps its last observation.
+
+    Only one worker runs the poller. It publishes every refresh to the shared
+    cache, where the stores of the other workers read it.
+    """
+
+    namespace = "ndbc_observations"
+
+    def __init__(self, buoy_client: NDBCBuoyClient, get_stations: Callable[[], List[Station]]):
+        self.buoy_client = buoy_client
+        self._get_stations = get_stations
+        self._observations: Dict[str, NDBCObservation] = {}
+        self._cache = get_cache()
+        self.is_polling = False
+        self.updated_at: Optional[datetime] = None
+
+    def key(self, station_id: str) -> str:
+        return f"{self.namespace}:station:{station_id}"
+
+    @property
+    def updated_at_key(self) -> str:
+        return f"{self.namespace}:updated_at"
+
+    async def is_loaded(self) -> bool:
+        """Whether observations have been refreshed at least once, by this worker or the poller's."""
+        if self.is_polling:
+            return self.updated_at is not None
+        return await self._cache.get(self.updated_at_key) is not None
+
+    async def get(self, station_id: str) -> Optional[NDBCObservation]:
+        """Get a station's latest observation, with its data age as of now."""
+        if self.is_polling:
+            observation = self._observations.get(station_id)
+        else:
+            observation = await self._cache.get(self.key(station_id))
+        if observation is None:
+            return None
+        return observation.model_copy(update={"data_age": get_data_age(observation.time)})
+
+    async def refresh(self, stations: Optional[List[Station]] = None) -> List[Station]:
+        """Refresh stations' observations, every station by default.
+
+        Returns the stations that failed with errors worth retrying. Stations
+        NDBC has no data for aren't retried before the next publish time.
+        """
+        stations = self._get_stations() if stations is None else stations
+        remaining = stations
+
+        if settings.ndbc_observation_polling["use_latest_obs"]:
+            try:
+                table = await self.buoy_client.get_latest_observations()
+                remaining = []
+                for station in stations:
+                    observation = table.get(station.station_id)
+                    if observation is None:
+                        remaining.append(station)
+                    else:
+                        self._observations[station.station_id] = observation
+            except Exception as e:
+                logger.warning(f"⚠️ Latest observations feed unavailable, fetching stations individually: {str(e)}")
+
+        failed = await self._refresh_stations(remaining)
+        self.updated_at = datetime.now(timezone.utc)
+        await self._publish()
+        logger.info(
+            f"🛰️ Refreshed observations for {len(stations) - len(failed)}/{len(stations)} stations "
+            f"({len(remaining)} fetched individually, {len(failed)} failed)"
+        )
+        return failed
+
+    async def _publish(self) -> None:
+        """Share every station's observation with the other workers."""
+        try:
+            pairs = [(self.key(station_id), observation) for station_id, observation in self._observations.items()]
+            pairs.append((self.updated_at_key, self.updated_at))
+            await self._cache.multi_set(pairs, ttl=OBSERVATIONS_EXPIRE)
+        except Exception as e:
+            logger.error(f"❌ Error publishing observations: {str(e)}")
+
+    async def _refresh_stations(self, stations: List[Station]) -> List[Station]:
+        """Fetch stations' observations one by one, at most `max_concurrency` at a time.
+
+        Returns the stations whose fetch failed, a station without data isn't a failure.
+        """
+        semaphore = asyncio.Semaphore(settings.ndbc_observation_polling["max_concurrency"])
+
+        async def refresh_station(station: Station) -> None:
+            async with semaphore:
+                station_data = await self.buoy_client.get_observation(station.station_id, {
+                    "name": station.name,
+                    "location": {
+                        "type": "Point",
+                        "coordinates": station.location.coordinates
+                    }
+                })
+            if station_data is not None:
+                self._observations[station.station_id] = station_data.observations
+
+        results = await asyncio.gather(
+            *(refresh_station(station) for station in stations),
+            return_exceptions=True
+        )
+        return [station for station, result in zip(stations, results) if isinstance(result, Exception)]
+
+    async def run(self) -> None:
+        """Poll shortly after every NDBC publish time, retrying failed stations sooner."""
+        self.is_polling = True
+        retry: Optional[List[Station]] = None
+        while True:
+            try:
+                failed = await self.refresh(retry)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error refreshing observations: {str(e)}")
+                failed = retry if retry is not None else self._get_stations()
+
+            now = datetime.now(timezone.utc)
+            next_poll = get_next_poll_time(now)
+            retry = None
+            if failed:
+                retry_time = now + timedelta(seconds=settings.ndbc_observation_polling["retry_seconds"])
+                if retry_time < next_poll:
+                    # Only the failed stations, the others are current until the next publish time
+                    next_poll, retry = retry_time, failed
+            await asyncio.sleep((next_poll - now).total_seconds())
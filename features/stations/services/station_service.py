@@ -7,6 +7,7 @@ from pathlib import Path
 from features.common.models.station_types import Station, Location
 from features.waves.models.ndbc_types import NDBCObservation
 from features.waves.services.ndbc_buoy_client import NDBCBuoyClient
+from features.stations.services.observation_store import ObservationStore
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,7 @@ class StationService:
         self.stations_file = stations_file
         self._stations: Optional[List[Station]] = None
         self.buoy_client = NDBCBuoyClient()
+        self.observation_store = ObservationStore(self.buoy_client, self.get_stations)
         
     def _load_stations(self) -> List[Station]:
         """Load NDBC stations from JSON file."""
@@ -43,6 +45,10 @@ class StationService:
                 detail=f"Error loading station data: {str(e)}"
             )
 
+    def get_stations(self) -> List[Station]:
+        """Get all NDBC stations."""
+        return self._load_stations()
+
     def get_station(self, station_id: str) -> Station:
         """Get station by ID."""
         stations = self._load_stations()
@@ -59,25 +65,26 @@ class StationService:
         return station
 
     async def get_station_observations(self, station_id: str) -> NDBCObservation:
-        """Get current observations for a station."""
+        """Get current observations for a station from the observation store."""
         # Verify station exists
-        station = self.get_station(station_id)
+        self.get_station(station_id)
         
-        # Get observations from NDBC
-        station_data = await self.buoy_client.get_observation(station_id, {
-            "name": station.name,
-            "location": {
-                "type": "Point",
-                "coordinates": station.location.coordinates
-            }
-        })
-        if not station_data:
+        observation = await self.observation_store.get(station_id)
+        if observation is None:
+            if not await self.observation_store.is_loaded():
+                raise HTTPException(
+                    status_code=503,
+                    detail="Observations are still loading"
+                )
             raise HTTPException(
                 status_code=404,
                 detail=f"No observations found for station {station_id}"
             )
-        
-        return station_data.observations
+        return observation
+
+    async def poll_observations(self) -> None:
+        """Keep the observation store fresh in the background, shared with the other workers."""
+        await self.observation_store.run()
 
     async def get_stations_geojson(self) -> Dict:
         """Get stations in GeoJSON format."""
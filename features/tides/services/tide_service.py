@@ -13,6 +13,8 @@ from features.tides.models.tide_types import (
     GeoJSONFeature,
     TidePrediction
 )
+from features.common.services.cache_config import TIDE_PREDICTIONS_EXPIRE, get_cache
+from features.common.utils.conditional_get import ConditionalGet
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,8 @@ class TideService:
         """Initialize TideService."""
         self.data_url = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
         self.stations_file = Path(__file__).parent.parent.parent.parent / "tide_stations.json"
+        self._cache = get_cache()
+        self._conditional_get = ConditionalGet()
         
     async def get_all_stations(self) -> List[TideStation]:
         """Get list of all tide stations."""
@@ -75,7 +79,12 @@ class TideService:
         station_id: str,
         date: Optional[datetime] = None
     ) -> TideStationPredictions:
-        """Get tide predictions for a specific station."""
+        """Get tide predictions for a specific station, cached per station and start date."""
+        cache_key = f"tide_predictions:station:{station_id}:{(date or datetime.now()).strftime('%Y%m%d')}"
+        cached_predictions = await self._cache.get(cache_key)
+        if cached_predictions is not None:
+            return cached_predictions
+            
         try:
             # Get station info
             stations = self._get_stations_from_file()
@@ -98,11 +107,13 @@ class TideService:
                 for p in predictions_data
             ]
             
-            return TideStationPredictions(
+            response = TideStationPredictions(
                 id=station_id,
                 name=station["name"],
                 predictions=predictions
             )
+            await self._cache.set(cache_key, response, ttl=TIDE_PREDICTIONS_EXPIRE)
+            return response
             
         except HTTPException:
             raise
@@ -162,25 +173,25 @@ class TideService:
             }
 
             async with aiohttp.ClientSession() as session:
-                async with session.get(
+                data = await self._conditional_get.get(
+                    session,
                     self.data_url,
+                    json.loads,
                     params=params,
                     headers=headers,
                     timeout=30,
                     verify_ssl=False  # Disable SSL verification
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    
-                    if "error" in data:
-                        if "No Predictions data was found" in data["error"].get("message", ""):
-                            # Return empty list for stations without prediction data
-                            return []
-                        else:
-                            # Raise other API errors
-                            raise Exception(data["error"].get("message", "Unknown error from NOAA API"))
-                        
-                    return data.get("predictions", [])
+                )
+                
+            if "error" in data:
+                if "No Predictions data was found" in data["error"].get("message", ""):
+                    # Return empty list for stations without prediction data
+                    return []
+                else:
+                    # Raise other API errors
+                    raise Exception(data["error"].get("message", "Unknown error from NOAA API"))
+                
+            return data.get("predictions", [])
                     
         except aiohttp.ClientError as e:
             logger.error(f"Error fetching tide predictions for station {station_id}: {str(e)}")
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List
 from pydantic import BaseModel
 
@@ -33,6 +33,17 @@ class NDBCDataAge(BaseModel):
     minutes: float
     isStale: bool  # True if > 45 minutes old
 
+# Observations older than this are flagged as stale
+STALE_OBSERVATION_MINUTES = 45
+
+def get_data_age(obs_time: datetime, now: Optional[datetime] = None) -> NDBCDataAge:
+    """Get the age of an observation, as of now by default."""
+    age_minutes = ((now or datetime.now(timezone.utc)) - obs_time).total_seconds() / 60
+    return NDBCDataAge(
+        minutes=age_minutes,
+        isStale=age_minutes > STALE_OBSERVATION_MINUTES
+    )
+
 class NDBCObservation(BaseModel):
     """Real-time observation from NDBC station."""
     time: datetime
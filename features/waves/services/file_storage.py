@@ -1,17 +1,32 @@
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import logging
+import re
+import shutil
 from features.common.services.model_run_service import ModelRun
-from typing import List, Tuple
+from features.common.utils.atomic_file import write_stream_atomic
+from features.common.utils.grib_manifest import GribManifest, GribStreamInspector, inspect_grib_stream
+from features.common.services.decode_pool import run_in_decode_pool
+from features.common.utils.forecast_grid import ForecastGrid
+from features.common.utils.grib_store import (
+    append_store_from_files,
+    build_store_from_files,
+    is_store_current
+)
+from typing import AsyncIterator, Dict, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Model run id in file names, e.g. `_20250218_06z`
+RUN_ID_PATTERN = re.compile(r"_(\d{8}_\d{2}z)")
+
 class GFSWaveFileStorage:
     """Handles storage and retrieval of GFS Wave GRIB files."""
     
     def __init__(self, base_dir: str = "downloaded_data/gfs_wave"):
         """Initialize the file storage with a base directory."""
         self.base_dir = Path(base_dir)
+        self._manifests: Dict[str, GribManifest] = {}  # manifest file name -> loaded manifest
         self._ensure_storage_dir()
     
     def _ensure_storage_dir(self) -> None:
@@ -22,16 +37,43 @@ class GFSWaveFileStorage:
         """Generate the path for a regional GFS file."""
         return self.base_dir / f"{region}_gfs_{model_run.date_str}_{model_run.cycle_hour:02d}z_f{forecast_hour:03d}.grib2"
     
-    def is_file_valid(self, file_path: Path) -> bool:
-        """Check if a file exists."""
-        return file_path.exists()
+    def get_store_path(self, region: str, model_run: ModelRun) -> Path:
+        """Generate the path for a region's decoded Zarr store."""
+        return self.base_dir / f"{region}_gfs_{model_run.date_str}_{model_run.cycle_hour:02d}z.zarr"
+    
+    def get_manifest_path(self, model_run: ModelRun) -> Path:
+        """Generate the path for a model run's GRIB manifest."""
+        return self.base_dir / f"gfs_{model_run.date_str}_{model_run.cycle_hour:02d}z.manifest.json"
+    
+    def get_manifest(self, model_run: ModelRun) -> GribManifest:
+        """Get a model run's manifest, loading it from disk once."""
+        manifest_path = self.get_manifest_path(model_run)
+        manifest = self._manifests.get(manifest_path.name)
+        if manifest is None:
+            manifest = GribManifest(manifest_path)
+            self._manifests[manifest_path.name] = manifest
+        return manifest
     
-    async def save_file(self, file_path: Path, content: bytes) -> bool:
-        """Save file content to storage."""
+    def is_file_valid(self, model_run: ModelRun, file_path: Path) -> bool:
+        """Check if a file was verified as complete GRIB when it was downloaded."""
+        return self.get_manifest(model_run).get(file_path.name) is not None
+    
+    async def save_stream(
+        self,
+        model_run: ModelRun,
+        file_path: Path,
+        chunks: AsyncIterator[bytes],
+        min_size: int = 0
+    ) -> bool:
+        """Stream file content to storage, keeping it only if it is complete GRIB."""
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, 'wb') as f:
-                f.write(content)
+            inspector = GribStreamInspector()
+            await write_stream_atomic(file_path, inspect_grib_stream(chunks, inspector), min_size)
+            record = inspector.finish()
+            self.get_manifest(model_run).record(file_path.name, record)
+            logger.debug(
+                f"Saved {record.size} bytes ({record.message_count} messages) to {file_path.name}"
+            )
             return True
         except Exception as e:
             logger.error(f"Error saving file {file_path}: {str(e)}")
@@ -47,7 +89,7 @@ class GFSWaveFileStorage:
         missing = []
         for hour in forecast_hours:
             file_path = self.get_regional_file_path(region, model_run, hour)
-            if not self.is_file_valid(file_path):
+            if not self.is_file_valid(model_run, file_path):
                 missing.append((hour, file_path))
         return missing
     
@@ -61,23 +103,91 @@ class GFSWaveFileStorage:
         valid = []
         for hour in forecast_hours:
             file_path = self.get_regional_file_path(region, model_run, hour)
-            if self.is_file_valid(file_path):
+            if self.is_file_valid(model_run, file_path):
                 valid.append(file_path)
         
         return valid
     
-    def cleanup_old_files(self, current_run: ModelRun) -> None:
-        """Delete files from older model runs."""
+    async def build_store(
+        self,
+        region: str,
+        model_run: ModelRun,
+        forecast_hours: List[int]
+    ) -> Optional[Path]:
+        """Decode a run's GRIB files once into a Zarr store, reusing an up-to-date store.
+
+        Decoding runs in the decode pool so the event loop keeps serving requests.
+        """
+        hours = [
+            hour for hour in forecast_hours
+            if self.is_file_valid(model_run, self.get_regional_file_path(region, model_run, hour))
+        ]
+        if not hours:
+            return None
+            
+        store_path = self.get_store_path(region, model_run)
+        if is_store_current(store_path, hours):
+            return store_path
+            
+        logger.info(f"🗜️ Decoding {len(hours)} wave files for {region} into {store_path.name}")
+        return await run_in_decode_pool(
+            build_store_from_files,
+            [self.get_regional_file_path(region, model_run, hour) for hour in hours],
+            store_path,
+            hours
+        )
+    
+    async def append_to_store(
+        self,
+        region: str,
+        model_run: ModelRun,
+        forecast_hours: List[int],
+        variables: List[str],
+        compact: bool = False
+    ) -> ForecastGrid:
+        """Decode newly downloaded hours into the region's store and return them as a cube."""
+        logger.info(f"🗜️ Appending {len(forecast_hours)} wave files for {region} to its store")
+        return await run_in_decode_pool(
+            append_store_from_files,
+            [self.get_regional_file_path(region, model_run, hour) for hour in forecast_hours],
+            self.get_store_path(region, model_run),
+            forecast_hours,
+            variables,
+            compact=compact
+        )
+    
+    def cleanup_old_files(self, keep_runs: List[ModelRun]) -> None:
+        """Delete files and stores of model runs older than the newest kept run, except the kept runs.
+        
+        Newer runs, e.g. one being prefetched, are left alone.
+        """
         try:
-            current_pattern = f"*_{current_run.date_str}_{current_run.cycle_hour:02d}z_*.grib2"
+            keep_ids = {f"{run.date_str}_{run.cycle_hour:02d}z" for run in keep_runs}
+            newest_id = max(keep_ids)
+            
+            def is_old(path: Path) -> bool:
+                match = RUN_ID_PATTERN.search(path.name)
+                return match is not None and match.group(1) not in keep_ids and match.group(1) < newest_id
+                
             deleted_count = 0
             
             for file_path in self.base_dir.glob("*.grib2"):
-                if current_pattern not in str(file_path):
+                if is_old(file_path):
                     file_path.unlink()
                     deleted_count += 1
                     
+            for store_path in self.base_dir.glob("*.zarr"):
+                if is_old(store_path):
+                    shutil.rmtree(store_path)
+                    deleted_count += 1
+                    
+            for manifest_path in self.base_dir.glob("*.manifest.json"):
+                if is_old(manifest_path):
+                    manifest_path.unlink()
+                    self._manifests.pop(manifest_path.name, None)
+                    deleted_count += 1
+                    
             if deleted_count > 0:
                 logger.info(f"Cleaned up {deleted_count} wave files from previous model runs")
         except Exception as e:
-            logger.error(f"Error during cleanup: {str(e)}") 
\ No newline at end of file
+            logger.error(f"Error during cleanup: {str(e)}")
\ No newline at end of file
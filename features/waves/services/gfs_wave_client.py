@@ -1,11 +1,10 @@
 import logging
 import aiohttp
-import xarray as xr
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional, List, Dict
 from pydantic import BaseModel, Field
 import asyncio
 from fastapi import HTTPException
@@ -13,8 +12,17 @@ from fastapi import HTTPException
 from features.common.models.station_types import Station
 from features.common.utils.conversions import UnitConversions
 from core.config import settings
-from features.common.model_run import ModelRun
+from features.common.model_run import ForecastSegment, ModelRun
 from features.waves.services.file_storage import GFSWaveFileStorage
+from features.common.utils.forecast_grid import ForecastGrid, StationSeriesTable
+from features.common.utils.grid_index import StationGridIndex
+from features.common.services.rate_limiter import nomads_rate_limiter
+from features.common.services.grib_byte_range import get_byte_ranges, stream_byte_ranges
+from features.common.utils.atomic_file import DOWNLOAD_CHUNK_SIZE
+from features.common.utils.grib_store import load_forecast_grid
+from features.common.services.decode_pool import run_in_decode_pool
+from features.common.services.forecast_backfill import run_forecast_backfill
+from features.stations.services.station_service import StationService
 
 logger = logging.getLogger(__name__)
 
@@ -46,17 +54,23 @@ class GFSWaveForecast(BaseModel):
     station_info: Station
     cycle: GFSModelCycle
     forecasts: List[GFSForecastPoint]
+    segments: List[ForecastSegment] = Field(default_factory=list, description="Model run each span of the forecast came from")
 
 class GFSWaveClient:
-    # Rate limiting constants
-    REQUESTS_PER_MINUTE = 120
-    REQUEST_INTERVAL = 60 / REQUESTS_PER_MINUTE  # Time between requests in seconds
-    BATCH_SIZE = 30  # Number of requests to make before pausing
-    BATCH_PAUSE = 15  # Seconds to pause after each batch
+    # Variables held in the resident regional cube
+    WAVE_VARIABLES = ["swh", "perpw", "dirpw"]
+    # (variable, level) messages fetched in byte-range mode
+    WAVE_MESSAGES = [("HTSGW", "surface"), ("PERPW", "surface"), ("DIRPW", "surface")]
     
-    def __init__(self, model_run: Optional[ModelRun] = None):
+    def __init__(
+        self,
+        model_run: Optional[ModelRun] = None,
+        station_service: Optional[StationService] = None,
+        previous_client: Optional["GFSWaveClient"] = None
+    ):
         self._session: Optional[aiohttp.ClientSession] = None
         self.model_run = model_run
+        self.station_service = station_service or StationService()
         self._is_initialized = False
         self._initialization_lock = asyncio.Lock()
         self._initialization_error: Optional[str] = None
@@ -65,14 +79,23 @@ class GFSWaveClient:
         self.regions = list(settings.models.keys())
         # Get forecast hours from config and create list
         self.forecast_hours = list(range(0, settings.forecast_hours + 1, 3))  # 0 to max by 3-hour steps
-        self._request_count = 0
-        self._last_request_time = datetime.now()
+        # Previous run's client, serving the hours past those loaded during a progressive start
+        self.previous_client = previous_client
+        if previous_client:
+            early_hours = settings.progressive_serving["early_forecast_hours"]
+            self.forecast_hours = [hour for hour in self.forecast_hours if hour <= early_hours]
+        self._grids: Dict[str, ForecastGrid] = {}  # region -> resident forecast cube
+        self._station_indexes: Dict[str, StationGridIndex] = {}  # region -> station grid cells
+        self._station_tables: Dict[str, StationSeriesTable] = {}  # region -> all-station series
         
     def update_model_run(self, model_run: ModelRun):
         """Update the current model run."""
         self.model_run = model_run
         self._is_initialized = False
         self._initialization_error = None
+        self._grids.clear()
+        self._station_indexes.clear()
+        self._station_tables.clear()
         
     async def initialize(self):
         """Initialize the wave client by loading the latest model run data."""
@@ -91,40 +114,10 @@ class GFSWaveClient:
             
             # Initialize each configured region
             for region in self.regions:
-                try:
-                    logger.info(f"🌊 Initializing {region} region wave data...")
-                    
-                    # Download any missing files
-                    file_paths = await self._download_regional_files(
-                        self.model_run.run_date,
-                        f"{self.model_run.cycle_hour:02d}",
-                        region
-                    )
-                    
-                    if not file_paths:
-                        error_msg = f"No data files available for {region}"
-                        initialization_errors.append(error_msg)
-                        logger.error(error_msg)
-                        continue
-                        
-                    # Try loading one file to verify data access
-                    test_ds = await self._load_grib_files(
-                        region,
-                        self.model_run.run_date,
-                        f"{self.model_run.cycle_hour:02d}"
-                    )
-                    if test_ds is None:
-                        error_msg = f"Failed to load test dataset for {region}"
-                        initialization_errors.append(error_msg)
-                        logger.error(error_msg)
-                        continue
-                    test_ds.close()
-                        
-                except Exception as e:
-                    error_msg = f"Error initializing {region} wave data: {str(e)}"
+                error_msg = await self._load_region(region)
+                if error_msg:
                     initialization_errors.append(error_msg)
                     logger.error(error_msg)
-                    continue
             
             if initialization_errors:
                 self._initialization_error = "; ".join(initialization_errors)
@@ -140,6 +133,181 @@ class GFSWaveClient:
                 f"{self.model_run.run_date.strftime('%Y%m%d')} {self.model_run.cycle_hour:02d}Z"
             )
 
+    async def _load_region(self, region: str) -> Optional[str]:
+        """Download and load a region's forecast hours, returning an error message on failure."""
+        try:
+            logger.info(f"🌊 Initializing {region} region wave data...")
+            
+            # Download any missing files
+            file_paths = await self._download_regional_files(
+                self.model_run.run_date,
+                f"{self.model_run.cycle_hour:02d}",
+                region
+            )
+            
+            if not file_paths:
+                return f"No data files available for {region}"
+                
+            # Build the resident cube once per model run
+            grid = await self._load_grib_files(
+                region,
+                self.model_run.run_date,
+                f"{self.model_run.cycle_hour:02d}"
+            )
+            if grid is None:
+                return f"Failed to load dataset for {region}"
+            
+            self._set_region_grid(region, grid)
+            return None
+                
+        except Exception as e:
+            return f"Error initializing {region} wave data: {str(e)}"
+    
+    def _set_region_grid(self, region: str, grid: ForecastGrid) -> None:
+        """Index a region's loaded cube for its stations and start serving it."""
+        station_index = StationGridIndex.build(
+            grid.latitudes,
+            grid.longitudes,
+            self._get_region_stations(region)
+        )
+        self._station_tables[region] = grid.extract_stations(station_index)
+        self._station_indexes[region] = station_index
+        self._grids[region] = grid
+        logger.info(
+            f"📦 Loaded {region} wave cube {grid.values.shape} "
+            f"({grid.nbytes / 1e6:.1f} MB) indexed for "
+            f"{len(station_index)} stations"
+        )
+    
+    async def restore(self) -> bool:
+        """Load the model run from its decoded stores on disk without contacting NOMADS.
+        
+        Returns False if any region's store is missing or unreadable.
+        """
+        async with self._initialization_lock:
+            for region in self.regions:
+                store_path = self.file_storage.get_store_path(region, self.model_run)
+                grid = await run_in_decode_pool(
+                    load_forecast_grid,
+                    store_path,
+                    self.WAVE_VARIABLES,
+                    settings.compact_grids
+                )
+                if grid is None:
+                    logger.warning(f"⚠️ No decoded wave store to restore for {region}")
+                    return False
+                self._set_region_grid(region, grid)
+                
+            self._is_initialized = True
+            logger.info(f"⚡ Restored wave model run {self.model_run} from disk")
+            return True
+    
+    def get_expected_time(self, forecast_hour: int) -> datetime:
+        """Get when a forecast hour of the current run is expected on NOMADS.
+
+        GFS files become available progressively, with early hours first.
+        """
+        return self.model_run.available_time + timedelta(minutes=max(5, forecast_hour // 6))
+    
+    def _get_unloaded_hours(self, region: str) -> List[int]:
+        """Get forecast hours of the full run missing from a region's loaded cube.
+        
+        A region that failed to load at all is missing every hour.
+        """
+        full_hours = list(range(0, settings.forecast_hours + 1, 3))
+        if region not in self._grids:
+            return full_hours
+        run_start = np.datetime64(
+            datetime.combine(self.model_run.run_date, time(hour=self.model_run.cycle_hour))
+        )
+        loaded = set(((self._grids[region].times - run_start) // np.timedelta64(1, "h")).tolist())
+        return [hour for hour in full_hours if hour not in loaded]
+    
+    def get_pending_hours(self) -> List[int]:
+        """Get forecast hours of the full run still missing from any region."""
+        pending = set()
+        for region in self.regions:
+            pending.update(self._get_unloaded_hours(region))
+        return sorted(pending)
+    
+    @property
+    def is_complete(self) -> bool:
+        """Whether every region's cube holds all forecast hours of the run."""
+        return bool(self.model_run) and not self.get_pending_hours()
+    
+    async def backfill(self, forecast_hours: List[int]) -> int:
+        """Download forecast hours missing from the loaded cubes and merge them in.
+        
+        Only the new hours are decoded and appended to each region's store.
+        Returns the number of region forecast hours added.
+        """
+        cycle_hour = f"{self.model_run.cycle_hour:02d}"
+        added = 0
+        for region in self.regions:
+            try:
+                unloaded_hours = [hour for hour in self._get_unloaded_hours(region) if hour in forecast_hours]
+                if not unloaded_hours:
+                    continue
+                    
+                # Files already on disk, e.g. after a progressive start, only need loading
+                await self._download_regional_files(
+                    self.model_run.run_date,
+                    cycle_hour,
+                    region,
+                    unloaded_hours
+                )
+                new_hours = [
+                    hour for hour in unloaded_hours
+                    if self.file_storage.is_file_valid(
+                        self.model_run,
+                        self.file_storage.get_regional_file_path(region, self.model_run, hour)
+                    )
+                ]
+                if not new_hours:
+                    continue
+                    
+                grid = self._grids.get(region)
+                if grid is None:
+                    # Nothing loaded for the region yet, decode all its valid files
+                    grid = await self._load_grib_files(
+                        region,
+                        self.model_run.run_date,
+                        cycle_hour,
+                        self._get_unloaded_hours(region)
+                    )
+                    if grid is None:
+                        continue
+                    self._set_region_grid(region, grid)
+                    added += len(new_hours)
+                    continue
+                    
+                new_grid = await self.file_storage.append_to_store(
+                    region,
+                    self.model_run,
+                    new_hours,
+                    self.WAVE_VARIABLES,
+                    settings.compact_grids
+                )
+                
+                # Swap in the merged cube and its station table together
+                merged = grid.merge(new_grid)
+                self._station_tables[region] = merged.extract_stations(self._station_indexes[region])
+                self._grids[region] = merged
+                added += len(new_hours)
+                logger.info(
+                    f"🧩 Backfilled {len(new_hours)} wave forecast hours for {region}, "
+                    f"now {len(merged.times)} hours loaded"
+                )
+                
+            except Exception as e:
+                logger.error(f"❌ Error backfilling {region} wave data: {str(e)}")
+                
+        return added
+    
+    async def run_backfill(self, on_update: Callable[[], Awaitable[Any]]) -> bool:
+        """Backfill the run's missing hours as they become due, returning whether it was completed."""
+        return await run_forecast_backfill(self, "wave", on_update)
+
     async def _ensure_initialized(self):
         """Ensure the client is initialized before processing requests."""
         if not self._is_initialized:
@@ -183,6 +351,16 @@ class GFSWaveClient:
             
         return "pacific"
 
+    def _get_region_stations(self, region: str) -> List[Station]:
+        """Get the stations served by a region."""
+        return [
+            station for station in self.station_service.get_stations()
+            if self._get_region_for_station(
+                station.location.coordinates[1],
+                station.location.coordinates[0]
+            ) == region
+        ]
+
     def _build_grib_filter_url(
         self,
         cycle_hour: str,
@@ -211,28 +389,43 @@ class GFSWaveClient:
         url = f"{settings.gfs_wave_filter_url}/filter_gfswave.pl?{query}"
         return url
 
-    async def _rate_limit(self):
-        """Implement rate limiting logic."""
-        now = datetime.now()
-        
-        # Reset counter if a minute has passed
-        if (now - self._last_request_time).total_seconds() >= 60:
-            self._request_count = 0
-            self._last_request_time = now
-            
-        # If we've hit our batch size, pause
-        if self._request_count > 0 and self._request_count % self.BATCH_SIZE == 0:
-            logger.info(f"⏸️ Pausing for {self.BATCH_PAUSE}s after batch of {self.BATCH_SIZE} requests...")
-            await asyncio.sleep(self.BATCH_PAUSE)
-            self._request_count = 0
-            self._last_request_time = datetime.now()
-            return
-            
-        # Otherwise, small delay between requests
-        if self._request_count > 0:
-            await asyncio.sleep(self.REQUEST_INTERVAL)
+    def _build_grib_file_url(
+        self,
+        cycle_hour: str,
+        forecast_hour: int,
+        region: str
+    ) -> str:
+        """Build the direct URL of a regional GRIB file in the NOMADS prod tree."""
+        product = settings.models[region]["name"]
+        return (
+            f"{settings.base_url}/gfs.{self.model_run.date_str}/{cycle_hour}/wave/gridded/"
+            f"gfswave.t{cycle_hour}z.{product}.f{forecast_hour:03d}.grib2"
+        )
+
+    async def _download_grib_messages(
+        self,
+        url: str,
+        file_path: Path
+    ) -> Optional[Path]:
+        """Download the wave messages of a GRIB file by byte range and save it."""
+        try:
+            session = await self._init_session()
+            ranges = await get_byte_ranges(session, url, self.WAVE_MESSAGES)
+            if not ranges:
+                return None
+                
+            if await self.file_storage.save_stream(
+                self.model_run,
+                file_path,
+                stream_byte_ranges(session, url, ranges),
+                min_size=100
+            ):
+                return file_path
+            return None
             
-        self._request_count += 1
+        except Exception as e:
+            logger.error(f"Error downloading file by byte range: {str(e)}")
+            return None
 
     async def _download_grib_file(
         self,
@@ -243,8 +436,8 @@ class GFSWaveClient:
         try:
             session = await self._init_session()
             
-            # Apply rate limiting before request
-            await self._rate_limit()
+            # Wait for a slot in the shared NOMADS budget
+            await nomads_rate_limiter.acquire()
             
             async with session.get(url, allow_redirects=True) as response:
                 if response.status != 200:
@@ -254,14 +447,12 @@ class GFSWaveClient:
                         logger.error(f"Redirect location: {location}")
                     return None
                     
-                content = await response.read()
-                content_size = len(content)
-                
-                if content_size < 100:
-                    logger.error(f"Downloaded file too small: {content_size} bytes")
-                    return None
-                    
-                if await self.file_storage.save_file(file_path, content):
+                if await self.file_storage.save_stream(
+                    self.model_run,
+                    file_path,
+                    response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE),
+                    min_size=100
+                ):
                     return file_path
                 return None
                 
@@ -273,14 +464,16 @@ class GFSWaveClient:
         self,
         cycle_date: datetime,
         cycle_hour: str,
-        region: str
+        region: str,
+        forecast_hours: Optional[List[int]] = None
     ) -> List[Path]:
-        """Download missing forecast files for a region."""
+        """Download missing forecast files for a region, of the client's hours by default."""
+        forecast_hours = self.forecast_hours if forecast_hours is None else forecast_hours
         try:
             missing_files = self.file_storage.get_missing_files(
                 region,
                 self.model_run,
-                self.forecast_hours
+                forecast_hours
             )
             
             if not missing_files:
@@ -288,18 +481,25 @@ class GFSWaveClient:
                 return self.file_storage.get_valid_files(
                     region,
                     self.model_run,
-                    self.forecast_hours
+                    forecast_hours
                 )
 
-            downloaded = failed = 0
+            semaphore = asyncio.Semaphore(settings.nomads_rate_limit["max_concurrent_downloads"])
             
-            for forecast_hour, file_path in missing_files:
-                url = self._build_grib_filter_url(cycle_hour, forecast_hour, region)
-                result = await self._download_grib_file(url, file_path)
-                if result:
-                    downloaded += 1
-                else:
-                    failed += 1
+            async def download(forecast_hour: int, file_path: Path) -> Optional[Path]:
+                async with semaphore:
+                    if settings.grib_download_mode == "byte_range":
+                        url = self._build_grib_file_url(cycle_hour, forecast_hour, region)
+                        return await self._download_grib_messages(url, file_path)
+                    url = self._build_grib_filter_url(cycle_hour, forecast_hour, region)
+                    return await self._download_grib_file(url, file_path)
+            
+            results = await asyncio.gather(*(
+                download(forecast_hour, file_path)
+                for forecast_hour, file_path in missing_files
+            ))
+            downloaded = sum(1 for result in results if result)
+            failed = len(results) - downloaded
                     
             if downloaded > 0:
                 logger.info(f"Downloaded {downloaded} files for {region}, {failed} failed")
@@ -307,65 +507,38 @@ class GFSWaveClient:
             return self.file_storage.get_valid_files(
                 region,
                 self.model_run,
-                self.forecast_hours
+                forecast_hours
             )
             
         except Exception as e:
             logger.error(f"Error downloading files for {region}: {str(e)}")
             raise
 
-    def _load_and_combine_dataset(self, file_paths: List[Path]) -> xr.Dataset:
-        """Load and combine GRIB files into a single dataset."""
-        datasets = []
-        
-        for fp in file_paths:
-            try:
-                if not fp.exists():
-                    continue
-                    
-                ds = xr.open_dataset(
-                    fp,
-                    engine="cfgrib",
-                    backend_kwargs={
-                        'indexpath': '',
-                        'use_cftime': False,
-                        'decode_times': True,
-                        'decode_timedelta': False
-                    }
-                )
-                
-                valid_time = pd.to_datetime(ds.valid_time.values)
-                ds = ds.assign_coords(time=valid_time)
-                datasets.append(ds)
-                
-            except Exception as e:
-                logger.error(f"Error loading {fp}: {str(e)}")
-                continue
-                
-        if not datasets:
-            raise Exception("No valid datasets were loaded")
-            
-        return xr.concat(datasets, dim="time").sortby("time")
-
     async def _load_grib_files(
         self,
         region: str,
         cycle_date: datetime,
-        cycle_hour: str
-    ) -> Optional[xr.Dataset]:
-        """Load GRIB files for a region and combine them into a single dataset."""
+        cycle_hour: str,
+        forecast_hours: Optional[List[int]] = None
+    ) -> Optional[ForecastGrid]:
+        """Load a region's resident cube, decoding its GRIB files into the store first if needed."""
         try:
-            file_paths = self.file_storage.get_valid_files(
+            store_path = await self.file_storage.build_store(
                 region,
                 self.model_run,
-                self.forecast_hours
+                self.forecast_hours if forecast_hours is None else forecast_hours
             )
                     
-            if not file_paths:
+            if not store_path:
                 logger.error(f"No GRIB files found for {region}")
                 return None
                 
-            return self._load_and_combine_dataset(file_paths)
+            return await run_in_decode_pool(
+                load_forecast_grid,
+                store_path,
+                self.WAVE_VARIABLES,
+                settings.compact_grids
+            )
             
         except Exception as e:
             logger.error(f"Error loading GRIB files for {region}: {str(e)}")
@@ -373,33 +546,31 @@ class GFSWaveClient:
 
     def _extract_station_forecast(
         self,
-        dataset: xr.Dataset,
-        lat: float,
-        lon: float
+        table: StationSeriesTable,
+        station_id: str
     ) -> List[GFSForecastPoint]:
-        """Extract forecast for a specific station from regional dataset."""
+        """Extract forecast for a station from the regional series table."""
         try:
-            # Convert to 0-360 longitude (we know dataset uses this)
-            query_lon = lon + 360 if lon < 0 else lon
+            series = table.series(station_id)
+            if series is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Station {station_id} is not indexed for wave forecasts"
+                )
             
-            # Get nearest point data
-            point_data = dataset.sel(
-                latitude=lat, 
-                longitude=query_lon, 
-                method="nearest"
-            )
+            height_idx = table.variable_index("swh")
+            period_idx = table.variable_index("perpw")
+            direction_idx = table.variable_index("dirpw")
 
             # Extract forecasts
             forecasts = []
-            for t in point_data.time.values:
-                time_data = point_data.sel(time=t)
-                
+            for t, values in zip(table.times, series):
                 try:
                     # Extract known data types
                     wave_data = WaveDataPoint(
-                        height=float(time_data.swh.item()),
-                        period=float(time_data.perpw.item()),
-                        direction=float(time_data.dirpw.item())
+                        height=float(values[height_idx]),
+                        period=float(values[period_idx]),
+                        direction=float(values[direction_idx])
                     )
                     
                     # Create forecast point
@@ -419,17 +590,65 @@ class GFSWaveClient:
                     continue
             
             if not forecasts:
-                logger.warning(
-                    f"No valid forecast points found for station at "
-                    f"lat={lat:.3f}, lon={lon:.3f}"
-                )
+                logger.warning(f"No valid forecast points found for station {station_id}")
             
-            return sorted(forecasts, key=lambda x: x.time)
+            return forecasts
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error extracting forecast: {str(e)}")
             raise
 
+    def _get_station_points(self, station_id: str, station: Station) -> List[GFSForecastPoint]:
+        """Get a station's forecast points from this client's loaded run."""
+        lat = station.location.coordinates[1]
+        lon = station.location.coordinates[0]
+        
+        # Determine region and get its station series
+        region = self._get_region_for_station(lat, lon)
+        table = self._station_tables.get(region)
+        
+        if table is None:
+            raise HTTPException(
+                status_code=503,
+                detail=f"No data available for region {region}"
+            )
+        
+        return self._extract_station_forecast(table, station_id)
+
+    def _stitch_previous_run(
+        self,
+        station_id: str,
+        station: Station,
+        forecasts: List[GFSForecastPoint]
+    ) -> List[ForecastSegment]:
+        """Append hours past this run's loaded forecast from the previous run."""
+        segments = []
+        if forecasts:
+            segments.append(ForecastSegment(
+                model_run=self.model_run,
+                start=forecasts[0].time,
+                end=forecasts[-1].time
+            ))
+            
+        if self.previous_client and forecasts:
+            try:
+                later = [
+                    point for point in self.previous_client._get_station_points(station_id, station)
+                    if point.time > forecasts[-1].time
+                ]
+            except HTTPException:
+                later = []
+            if later:
+                forecasts.extend(later)
+                segments.append(ForecastSegment(
+                    model_run=self.previous_client.model_run,
+                    start=later[0].time,
+                    end=later[-1].time
+                ))
+        return segments
+
     async def get_station_forecast(self, station_id: str, station: Station) -> GFSWaveForecast:
         """Get wave forecast for a specific station."""
         try:
@@ -441,31 +660,9 @@ class GFSWaveClient:
                     detail="No model cycle currently available"
                 )
                 
-            # Get station coordinates
-            lat = station.location.coordinates[1]
-            lon = station.location.coordinates[0]
-            
-            # Determine region and get dataset
-            region = self._get_region_for_station(lat, lon)
-            
-            # Load dataset for this region
-            dataset = await self._load_grib_files(
-                region,
-                self.model_run.run_date,
-                f"{self.model_run.cycle_hour:02d}"
-            )
-            
-            if not dataset:
-                raise HTTPException(
-                    status_code=503,
-                    detail=f"No data available for region {region}"
-                )
-            
-            # Extract forecast
-            forecasts = self._extract_station_forecast(dataset, lat, lon)
-            
-            # Close dataset after use
-            dataset.close()
+            # Extract forecast, stitching later hours from the previous run while this one loads
+            forecasts = self._get_station_points(station_id, station)
+            segments = self._stitch_previous_run(station_id, station, forecasts)
             
             # Return forecast even if empty - let the service layer handle this
             return GFSWaveForecast(
@@ -474,7 +671,8 @@ class GFSWaveClient:
                     date=self.model_run.run_date.strftime("%Y%m%d"),
                     hour=f"{self.model_run.cycle_hour:02d}"
                 ),
-                forecasts=forecasts
+                forecasts=forecasts,
+                segments=segments
             )
             
         except HTTPException:
@@ -485,6 +683,3 @@ class GFSWaveClient:
                 status_code=500,
                 detail=f"Error processing wave forecast: {str(e)}"
             )
-            
-        finally:
-            await self.close() 
\ No newline at end of file
@@ -8,10 +8,12 @@ from features.waves.models.ndbc_types import (
     NDBCWindData,
     NDBCWaveData,
     NDBCMetData,
-    NDBCDataAge,
     NDBCObservation,
-    NDBCStation
+    NDBCStation,
+    get_data_age
 )
+from features.waves.services.ndbc_latest_obs import LatestObservationTable
+from features.common.utils.conditional_get import ConditionalGet
 from core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,7 @@ logger = logging.getLogger(__name__)
 class NDBCBuoyClient:
     def __init__(self):
         self._session: Optional[aiohttp.ClientSession] = None
+        self._conditional_get = ConditionalGet()
         
     async def _init_session(self) -> aiohttp.ClientSession:
         if not self._session:
@@ -39,6 +42,24 @@ class NDBCBuoyClient:
         except (ValueError, TypeError):
             return None
 
+    async def get_latest_observations(self) -> LatestObservationTable:
+        """Get NDBC's latest_obs.txt feed, holding the latest observation of every station."""
+        try:
+            session = await self._init_session()
+            return await self._conditional_get.get(
+                session,
+                settings.ndbc_latest_obs_url,
+                LatestObservationTable.parse,
+                timeout=30,
+                verify_ssl=False  # Disable SSL verification
+            )
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching latest observations feed: {str(e)}")
+            raise HTTPException(
+                status_code=503,
+                detail=f"Error fetching latest observations feed: {str(e)}"
+            )
+
     async def get_observation(self, station_id: str, station_info: Dict) -> Optional[NDBCStation]:
         """Get latest observation data for a station."""
         try:
@@ -47,74 +68,24 @@ class NDBCBuoyClient:
             # Construct URL for standard meteorological data
             url = f"{settings.ndbc_base_url}{station_id}.{settings.ndbc_data_types['std']}"
             
-            async with session.get(
+            return await self._conditional_get.get(
+                session,
                 url,
+                lambda text: self._parse_observation(text, station_id, station_info),
                 timeout=30,
                 verify_ssl=False  # Disable SSL verification
-            ) as response:
-                response.raise_for_status()
-                text = await response.text()
-                
-                if not text:
-                    return None
-                    
-                # Parse the text data (NDBC standard format)
-                lines = text.strip().split('\n')
-                if len(lines) < 2:  # Need at least header and one data line
-                    return None
-                    
-                # Get latest observation (first data line after header)
-                headers = lines[0].strip().split()
-                data = lines[2].strip().split()  # Skip units line
-                data_dict = dict(zip(headers, data))
-                
-                # Parse time
-                obs_time = datetime.strptime(
-                    f"{data_dict['#YY']}-{data_dict['MM']}-{data_dict['DD']} {data_dict['hh']}:{data_dict['mm']}",
-                    "%Y-%m-%d %H:%M"
-                )
-                obs_time = obs_time.replace(tzinfo=timezone.utc)
-                age_minutes = (datetime.now(timezone.utc) - obs_time).total_seconds() / 60
-                
-                observation = NDBCObservation(
-                    time=obs_time,
-                    wind=NDBCWindData(
-                        speed=self._parse_value(data_dict.get('WSPD')),
-                        direction=self._parse_value(data_dict.get('WDIR')),
-                        gust=self._parse_value(data_dict.get('GST'))
-                    ),
-                    wave=NDBCWaveData(
-                        height=self._parse_value(data_dict.get('WVHT')),
-                        period=self._parse_value(data_dict.get('DPD')),
-                        direction=self._parse_value(data_dict.get('MWD')),
-                        average_period=self._parse_value(data_dict.get('APD')),
-                        steepness=data_dict.get('STEEPNESS', '')
-                    ),
-                    met=NDBCMetData(
-                        pressure=self._parse_value(data_dict.get('PRES')),
-                        air_temp=self._parse_value(data_dict.get('ATMP')),
-                        water_temp=self._parse_value(data_dict.get('WTMP')),
-                        dewpoint=self._parse_value(data_dict.get('DEWP')),
-                        visibility=self._parse_value(data_dict.get('VIS')),
-                        pressure_tendency=self._parse_value(data_dict.get('PTDY')),
-                        water_level=self._parse_value(data_dict.get('TIDE'))
-                    ),
-                    data_age=NDBCDataAge(
-                        minutes=age_minutes,
-                        isStale=age_minutes > 45
-                    )
-                )
-
-                return NDBCStation(
-                    station_id=station_id,
-                    name=station_info["name"],
-                    location={
-                        "type": "Point",
-                        "coordinates": station_info["location"]["coordinates"]
-                    },
-                    observations=observation
-                )
+            )
                 
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                # Stations without realtime data have no file to fetch
+                logger.info(f"No observation data published for station {station_id}")
+                return None
+            logger.error(f"Error fetching observation for station {station_id}: {str(e)}")
+            raise HTTPException(
+                status_code=503,
+                detail=f"Error fetching observation data: {str(e)}"
+            )
         except aiohttp.ClientError as e:
             logger.error(f"Error fetching observation for station {station_id}: {str(e)}")
             raise HTTPException(
@@ -126,4 +97,62 @@ class NDBCBuoyClient:
             raise HTTPException(
                 status_code=500,
                 detail=f"Error processing observation data: {str(e)}"
-            ) 
\ No newline at end of file
+            )
+
+    def _parse_observation(self, text: str, station_id: str, station_info: Dict) -> Optional[NDBCStation]:
+        """Parse the latest observation from a station's standard meteorological data file."""
+        if not text:
+            return None
+            
+        # Parse the text data (NDBC standard format)
+        lines = text.strip().split('\n')
+        if len(lines) < 2:  # Need at least header and one data line
+            return None
+            
+        # Get latest observation (first data line after header)
+        headers = lines[0].strip().split()
+        data = lines[2].strip().split()  # Skip units line
+        data_dict = dict(zip(headers, data))
+        
+        # Parse time
+        obs_time = datetime.strptime(
+            f"{data_dict['#YY']}-{data_dict['MM']}-{data_dict['DD']} {data_dict['hh']}:{data_dict['mm']}",
+            "%Y-%m-%d %H:%M"
+        )
+        obs_time = obs_time.replace(tzinfo=timezone.utc)
+        
+        observation = NDBCObservation(
+            time=obs_time,
+            wind=NDBCWindData(
+                speed=self._parse_value(data_dict.get('WSPD')),
+                direction=self._parse_value(data_dict.get('WDIR')),
+                gust=self._parse_value(data_dict.get('GST'))
+            ),
+            wave=NDBCWaveData(
+                height=self._parse_value(data_dict.get('WVHT')),
+                period=self._parse_value(data_dict.get('DPD')),
+                direction=self._parse_value(data_dict.get('MWD')),
+                average_period=self._parse_value(data_dict.get('APD')),
+                steepness=data_dict.get('STEEPNESS', '')
+            ),
+            met=NDBCMetData(
+                pressure=self._parse_value(data_dict.get('PRES')),
+                air_temp=self._parse_value(data_dict.get('ATMP')),
+                water_temp=self._parse_value(data_dict.get('WTMP')),
+                dewpoint=self._parse_value(data_dict.get('DEWP')),
+                visibility=self._parse_value(data_dict.get('VIS')),
+                pressure_tendency=self._parse_value(data_dict.get('PTDY')),
+                water_level=self._parse_value(data_dict.get('TIDE'))
+            ),
+            data_age=get_data_age(obs_time)
+        )
+
+        return NDBCStation(
+            station_id=station_id,
+            name=station_info["name"],
+            location={
+                "type": "Point",
+                "coordinates": station_info["location"]["coordinates"]
+            },
+            observations=observation
+        )
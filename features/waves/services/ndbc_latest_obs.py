@@ -0,0 +1,103 @@
+import io
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from features.waves.models.ndbc_types import (
+    NDBCWindData,
+    NDBCWaveData,
+    NDBCMetData,
+    NDBCObservation,
+    get_data_age
+)
+
+logger = logging.getLogger(__name__)
+
+# latest_obs.txt column -> (observation section, field)
+LATEST_OBS_FIELDS: Dict[str, Tuple[str, str]] = {
+    "WDIR": ("wind", "direction"),
+    "WSPD": ("wind", "speed"),
+    "GST": ("wind", "gust"),
+    "WVHT": ("wave", "height"),
+    "DPD": ("wave", "period"),
+    "APD": ("wave", "average_period"),
+    "MWD": ("wave", "direction"),
+    "PRES": ("met", "pressure"),
+    "PTDY": ("met", "pressure_tendency"),
+    "ATMP": ("met", "air_temp"),
+    "WTMP": ("met", "water_temp"),
+    "DEWP": ("met", "dewpoint"),
+    "VIS": ("met", "visibility"),
+    "TIDE": ("met", "water_level"),
+}
+
+class LatestObservationTable:
+    """Latest observation of every NDBC station, parsed from the bulk latest_obs.txt feed."""
+
+    def __init__(self, station_ids: List[str], times: List[datetime], values: np.ndarray):
+        self.times = times
+        self.values = values  # (station, field) in LATEST_OBS_FIELDS order, NaN where missing
+        self.fetched_at = datetime.now(timezone.utc)
+        self._positions = {station_id: i for i, station_id in enumerate(station_ids)}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @classmethod
+    def parse(cls, text: str) -> "LatestObservationTable":
+        """Parse the feed in one vectorized pass.
+
+        The first two lines are `#`-prefixed column names and units, and
+        missing values are `MM`.
+        """
+        columns = text.split("\n", 1)[0].lstrip("#").split()
+        frame = pd.read_csv(
+            io.StringIO(text),
+            sep=r"\s+",
+            comment="#",
+            header=None,
+            names=columns,
+            na_values=["MM"],
+            dtype={"STN": str}
+        )
+        frame = frame.drop_duplicates(subset="STN")
+
+        # Month is "MM" and minute is "mm" in the feed's header
+        times = pd.to_datetime(
+            pd.DataFrame({
+                "year": frame["YYYY"],
+                "month": frame["MM"],
+                "day": frame["DD"],
+                "hour": frame["hh"],
+                "minute": frame["mm"],
+            }),
+            utc=True
+        )
+        values = (
+            frame.reindex(columns=list(LATEST_OBS_FIELDS))
+            .apply(pd.to_numeric, errors="coerce")
+            .to_numpy(dtype=np.float64)
+        )
+        return cls(frame["STN"].tolist(), times.dt.to_pydatetime().tolist(), values)
+
+    def get(self, station_id: str) -> Optional[NDBCObservation]:
+        """Get a station's latest observation, with its data age as of now."""
+        position = self._positions.get(station_id)
+        if position is None:
+            return None
+
+        sections: Dict[str, Dict[str, Optional[float]]] = {"wind": {}, "wave": {}, "met": {}}
+        for (section, field), value in zip(LATEST_OBS_FIELDS.values(), self.values[position]):
+            sections[section][field] = None if np.isnan(value) else float(value)
+
+        obs_time = self.times[position]
+        return NDBCObservation(
+            time=obs_time,
+            wind=NDBCWindData(**sections["wind"]),
+            wave=NDBCWaveData(**sections["wave"]),
+            met=NDBCMetData(**sections["met"]),
+            data_age=get_data_age(obs_time)
+        )
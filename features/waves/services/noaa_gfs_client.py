@@ -7,6 +7,7 @@ from fastapi import HTTPException
 
 from features.common.models.station_types import Station
 from features.common.utils.conversions import UnitConversions
+from features.common.utils.conditional_get import ConditionalGet
 from core.config import settings
 from features.common.model_run import ModelRun
 
@@ -154,6 +155,7 @@ def filter_forecasts_by_date_range(
 class NOAAGFSClient:
     def __init__(self, model_run: Optional[ModelRun] = None):
         self._session: Optional[aiohttp.ClientSession] = None
+        self._conditional_get = ConditionalGet()
         self.model_run = model_run
         
     def update_model_run(self, model_run: ModelRun):
@@ -182,25 +184,26 @@ class NOAAGFSClient:
             logger.error(f"Error checking cycle availability: {str(e)}")
             return False
 
-    async def _get_station_bulletin(self, station_id: str, date: str, hour: str) -> Optional[str]:
-        """Fetch the wave bulletin for a specific station."""
+    async def _get_station_bulletin(self, station_id: str, date: str, hour: str) -> Optional[List[GFSForecastPoint]]:
+        """Fetch and parse the wave bulletin for a specific station."""
         session = await self._init_session()
         url = f"{settings.gfs_wave_base_url}/gfs.{date}/{hour}/wave/station/bulls.t{hour}z/gfswave.{station_id}.bull"
         
         try:
-            async with session.get(url) as response:
-                if response.status == 404:
-                    logger.info(f"No wave bulletin available for station {station_id}")
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"Station {station_id} does not have GFS wave forecasts available"
-                    )
-                if response.status == 200:
-                    return await response.text()
-                logger.warning(f"Failed to fetch bulletin for station {station_id}: HTTP {response.status}")
-                return None
-        except HTTPException:
-            raise
+            return await self._conditional_get.get(
+                session,
+                url,
+                lambda bulletin_text: self._parse_bulletin(bulletin_text, date, hour)
+            )
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                logger.info(f"No wave bulletin available for station {station_id}")
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Station {station_id} does not have GFS wave forecasts available"
+                )
+            logger.warning(f"Failed to fetch bulletin for station {station_id}: HTTP {e.status}")
+            return None
         except Exception as e:
             logger.error(f"Error fetching bulletin for station {station_id}: {str(e)}")
             return None
@@ -236,14 +239,13 @@ class NOAAGFSClient:
             if not await self._check_cycle_availability(date, cycle_hour):
                 raise Exception(f"Latest GFS cycle not yet available: {date} {cycle_hour}Z")
                 
-            bulletin = await self._get_station_bulletin(station_id, date, cycle_hour)
-            if not bulletin:
+            current_forecasts = await self._get_station_bulletin(station_id, date, cycle_hour)
+            if current_forecasts is None:
                 raise HTTPException(
                     status_code=404,
                     detail=f"Station {station_id} does not have GFS wave forecasts available"
                 )
                 
-            current_forecasts = self._parse_bulletin(bulletin, date, cycle_hour)
             if not current_forecasts:
                 raise Exception(f"Failed to parse forecast data for station {station_id}")
             
@@ -259,17 +261,15 @@ class NOAAGFSClient:
                 prev_date = (datetime.strptime(date, "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d")
                 prev_hour = "18" if cycle_hour == "00" else f"{int(cycle_hour)-6:02d}"
                 
-                prev_bulletin = await self._get_station_bulletin(station_id, prev_date, prev_hour)
-                if prev_bulletin:
-                    prev_forecasts = self._parse_bulletin(prev_bulletin, prev_date, prev_hour)
-                    if prev_forecasts:
-                        prev_forecasts = filter_forecasts_by_date_range(
-                            prev_forecasts,
-                            today,
-                            current_forecasts[0].timestamp
-                        )
-                        logger.debug(f"Added {len(prev_forecasts)} forecasts from previous cycle")
-                        current_forecasts = prev_forecasts + current_forecasts
+                prev_forecasts = await self._get_station_bulletin(station_id, prev_date, prev_hour)
+                if prev_forecasts:
+                    prev_forecasts = filter_forecasts_by_date_range(
+                        prev_forecasts,
+                        today,
+                        current_forecasts[0].timestamp
+                    )
+                    logger.debug(f"Added {len(prev_forecasts)} forecasts from previous cycle")
+                    current_forecasts = prev_forecasts + current_forecasts
             
             return GFSWaveForecast(
                 station_info=station,
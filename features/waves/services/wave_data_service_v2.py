@@ -2,7 +2,7 @@ import logging
 from typing import Dict, List
 from fastapi import HTTPException
 from datetime import datetime, timedelta, timezone
-from aiocache import cached, SimpleMemoryCache
+import asyncio
 
 from features.waves.models.wave_types import (
     WaveForecastPoint,
@@ -12,11 +12,9 @@ from features.waves.services.gfs_wave_client import GFSWaveClient
 from features.waves.services.ndbc_buoy_client import NDBCBuoyClient
 from features.stations.services.station_service import StationService
 from features.common.services.model_run_service import ModelRun
-from features.common.services.cache_config import (
-    MODEL_FORECAST_EXPIRE,
-    feature_cache_key_builder,
-    get_cache
-)
+from features.common.model_run import describe_segments
+from features.common.services.cache_config import ModelRunCache, model_run_cache_id
+from features.common.utils.forecast_window import get_window_start, trim_to_window
 
 logger = logging.getLogger(__name__)
 
@@ -30,26 +28,71 @@ class WaveDataServiceV2:
         self.gfs_client = gfs_client
         self.buoy_client = buoy_client
         self.station_service = station_service
-        self._cache = get_cache()
+        self._cache = ModelRunCache("wave_forecast")
+        if gfs_client.model_run:
+            self._cache.set_run(model_run_cache_id(gfs_client.model_run))
 
     async def handle_model_run_update(self, model_run: ModelRun):
         """Handle model run update by clearing cache."""
         logger.info(f"🔄 Updating wave data service to model run: {model_run}")
         
-        # For now, just clear the entire cache on model run update
-        # This is safe because we're using SimpleMemoryCache
-        await self._cache.delete("wave_forecast:*")
-        logger.info("🗑️ Cleared wave forecast cache for new model run")
+        # Older runs' entries are no longer read and are evicted lazily
+        self._cache.set_run(model_run_cache_id(model_run))
+        logger.info(f"🗂️ Serving wave forecast cache generation {self._cache.run_id}")
+
+    def use_model_run_cache(self, model_run: ModelRun):
+        """Serve cached forecasts of a model run primed by another worker."""
+        self._cache.set_run(model_run_cache_id(model_run))
+
+    async def prime_cache(self) -> int:
+        """Build and cache the forecast of every station with the current GFS client.
+        
+        Entries are written into the client's model run generation, which is served
+        once every station is primed so readers never see a half-built generation.
+        """
+        run_id = model_run_cache_id(self.gfs_client.model_run)
+        primed = 0
+        for station in self.station_service.get_stations():
+            try:
+                # Skip the cache lookup so the entry is rebuilt from the current client
+                await self.get_station_forecast(station.station_id, cache_read=False)
+                primed += 1
+            except HTTPException as e:
+                logger.debug(f"Skipping wave cache priming for station {station.station_id}: {e.detail}")
+            # Let in-flight requests run between stations
+            await asyncio.sleep(0)
+            
+        self._cache.set_run(run_id)
+        logger.info(f"🔥 Primed wave forecast cache for {primed} stations ({run_id})")
+        return primed
+
+    async def get_station_forecast(self, station_id: str, cache_read: bool = True) -> WaveForecastResponse:
+        """Get wave model forecast for a specific station, cached per model run."""
+        if cache_read:
+            cached_response = await self._cache.get(station_id)
+            if cached_response is not None:
+                return trim_to_window(cached_response)
+                
+        # Workers that haven't loaded a run yet only serve what the ingesting worker primed
+        if not self.gfs_client.model_run:
+            raise HTTPException(
+                status_code=503,
+                detail="No model run loaded yet"
+            )
+                
+        # Key by the run the forecast was built from, so a concurrent run switch can't mislabel it,
+        # concurrent misses for the same station and run share a single build
+        run_id = model_run_cache_id(self.gfs_client.model_run)
+        
+        async def build_forecast() -> WaveForecastResponse:
+            response = await self._build_station_forecast(station_id)
+            logger.info(f"Caching forecast for station {station_id} with key {self._cache.key(station_id, run_id)}")
+            return response
+            
+        return await self._cache.build(station_id, run_id, build_forecast)
 
-    @cached(
-        ttl=MODEL_FORECAST_EXPIRE,
-        key_builder=feature_cache_key_builder,
-        namespace="wave_forecast",
-        cache=SimpleMemoryCache,
-        noself=True
-    )
-    async def get_station_forecast(self, station_id: str) -> WaveForecastResponse:
-        """Get wave model forecast for a specific station."""
+    async def _build_station_forecast(self, station_id: str) -> WaveForecastResponse:
+        """Build the wave model forecast for a specific station."""
         try:
             station = self.station_service.get_station(station_id)
             if not station:
@@ -74,8 +117,7 @@ class WaveDataServiceV2:
                 end_time = now + timedelta(days=7)
                 
                 # Round current time down to nearest 3-hour interval
-                now = now.replace(minute=0, second=0, microsecond=0)
-                now = now.replace(hour=(now.hour // 3) * 3)
+                now = get_window_start(now)
                 
                 # Convert to API response format
                 forecast_points = []
@@ -97,8 +139,14 @@ class WaveDataServiceV2:
                 # Sort forecasts by time to ensure order
                 forecast_points.sort(key=lambda x: x.time)
                 
-                # Get model run info from the forecast
-                model_run = f"{gfs_forecast.cycle.date} {gfs_forecast.cycle.hour}z"
+                # Get model run info from the forecast, naming each run it was stitched from
+                if gfs_forecast.segments:
+                    model_run = describe_segments(
+                        gfs_forecast.segments,
+                        lambda run: f"{run.run_date.strftime('%Y%m%d')} {run.cycle_hour:02d}z"
+                    )
+                else:
+                    model_run = f"{gfs_forecast.cycle.date} {gfs_forecast.cycle.hour}z"
                 
                 response = WaveForecastResponse(
                     station=station,
@@ -106,14 +154,6 @@ class WaveDataServiceV2:
                     model_run=model_run
                 )
                 
-                # Log cache key for debugging
-                cache_key = feature_cache_key_builder(
-                    self.get_station_forecast,
-                    namespace="wave_forecast",
-                    station_id=station_id
-                )
-                logger.info(f"Caching forecast for station {station_id} with key {cache_key}")
-                
                 return response
                 
             except Exception as e:
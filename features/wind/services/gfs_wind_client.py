@@ -1,12 +1,10 @@
 import aiohttp
 import logging
 import numpy as np
-import xarray as xr
-import cfgrib
 import pandas as pd
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, time, timezone, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, Dict
 import asyncio
 from fastapi import HTTPException
 
@@ -15,38 +13,59 @@ from features.common.models.station_types import Station
 from features.common.utils.conversions import UnitConversions
 from features.wind.utils.file_storage import GFSFileStorage
 from features.common.services.model_run_service import ModelRun
-from core.config import settings
+from features.common.model_run import ForecastSegment, describe_segments
+from features.common.utils.grid_index import StationGridIndex, station_bounding_box
+from features.common.utils.forecast_grid import ForecastGrid, StationSeriesTable
+from features.common.utils.grib_store import has_bounds, load_forecast_grid
+from features.common.services.decode_pool import run_in_decode_pool
+from features.common.services.forecast_backfill import run_forecast_backfill
+from features.common.services.rate_limiter import nomads_rate_limiter
+from features.common.services.grib_byte_range import get_byte_ranges, stream_byte_ranges
+from features.common.utils.atomic_file import DOWNLOAD_CHUNK_SIZE
+from features.stations.services.station_service import StationService
+from core.config import RegionGrid, settings
 
 logger = logging.getLogger(__name__)
 
 class GFSWindClient:
     """Client for fetching wind data from NOAA's GFS using NOMADS GRIB Filter."""
     
-    def __init__(self, model_run: Optional[ModelRun] = None):
+    # Variables held in the resident regional cube, speed and direction precomputed at ingest
+    WIND_VARIABLES = ["speed_mph", "direction", "gust"]
+    
+    def __init__(
+        self,
+        model_run: Optional[ModelRun] = None,
+        station_service: Optional[StationService] = None,
+        previous_client: Optional["GFSWindClient"] = None
+    ):
         self.model_run = model_run
+        self.station_service = station_service or StationService()
         self.file_storage = GFSFileStorage()
         self._is_initialized = False
         self._initialization_lock = asyncio.Lock()
         self._initialization_error: Optional[str] = None
         self.forecast_hours = settings.wind.forecast_hours
-        self._request_count = 0
-        self._last_request_time = datetime.now()
-        self._datasets: Dict[str, Dict[int, xr.Dataset]] = {}  # region -> {hour -> dataset}
-        
-        # Rate limiting constants from config
-        self.REQUESTS_PER_MINUTE = settings.wind.rate_limit["requests_per_minute"]
-        self.REQUEST_INTERVAL = 60 / self.REQUESTS_PER_MINUTE
-        self.BATCH_SIZE = settings.wind.rate_limit["batch_size"]
-        self.BATCH_PAUSE = settings.wind.rate_limit["batch_pause"]
+        # Previous run's client, serving the hours past those loaded during a progressive start
+        self.previous_client = previous_client
+        if previous_client:
+            early_hours = settings.progressive_serving["early_forecast_hours"]
+            self.forecast_hours = [hour for hour in self.forecast_hours if hour <= early_hours]
+        self._grids: Dict[str, ForecastGrid] = {}  # region -> resident forecast cube
+        self._station_indexes: Dict[str, StationGridIndex] = {}  # region -> station grid cells
+        self._station_tables: Dict[str, StationSeriesTable] = {}  # region -> all-station series
+        self._download_bounds: Dict[str, RegionGrid] = {}  # region -> station-covering subregion
         
     def update_model_run(self, model_run: ModelRun):
         """Update the current model run and clean up old files."""
         logger.info(f"🔄 Updating wind client model run to: {model_run}")
         self.model_run = model_run
-        self.file_storage.cleanup_old_files(model_run)
+        self.file_storage.cleanup_old_files([model_run])
         self._is_initialized = False
         self._initialization_error = None
-        self._datasets.clear()  # Clear cached datasets
+        self._grids.clear()
+        self._station_indexes.clear()
+        self._station_tables.clear()
         
     async def initialize(self):
         """Initialize the wind client by loading the latest model run data."""
@@ -68,6 +87,13 @@ class GFSWindClient:
                 try:
                     logger.info(f"🌎 Initializing {region_name} region wind data...")
                     
+                    self.file_storage.discard_if_bounds_changed(
+                        region_name,
+                        self.model_run,
+                        settings.wind.forecast_hours,
+                        self._get_download_bounds(region_name)
+                    )
+                    
                     # Get list of missing files but sort by forecast hour
                     missing_files = sorted(
                         self.file_storage.get_missing_files(
@@ -83,7 +109,7 @@ class GFSWindClient:
                         
                         # Calculate expected availability time for the first missing hour
                         first_hour = missing_files[0][0]
-                        expected_time = self.model_run.available_time + timedelta(minutes=max(5, first_hour // 6))
+                        expected_time = self.get_expected_time(first_hour)
                         
                         if datetime.now(timezone.utc) < expected_time:
                             wait_mins = (expected_time - datetime.now(timezone.utc)).total_seconds() / 60
@@ -95,19 +121,13 @@ class GFSWindClient:
                         
                         downloaded, failed = await self._download_regional_files(region_name, missing_files)
                         
-                        if downloaded == 0:
-                            error_msg = f"Failed to download any wind files for {region_name}"
-                            initialization_errors.append(error_msg)
-                            logger.error(f"❌ {error_msg}")
-                            continue
-                            
                         logger.info(f"📊 {region_name} wind download summary: {downloaded} succeeded, {failed} failed")
                         
                         # If we have some successful downloads but not all, log a warning
-                        if failed > 0:
+                        if failed > 0 or downloaded < len(missing_files):
                             logger.warning(
                                 f"⚠️ Some forecast hours not yet available for {region_name} "
-                                f"({failed} missing, will retry on next update)"
+                                f"({len(missing_files) - downloaded} missing, left for backfill)"
                             )
                     else:
                         logger.info(f"✨ All wind files already available for {region_name}")
@@ -127,32 +147,14 @@ class GFSWindClient:
                         
                     logger.info(f"🔄 Loading {len(valid_files)} wind files for {region_name}...")
                     
-                    # Initialize region's dataset cache
-                    self._datasets[region_name] = {}
-                    
-                    # Load each file into a dataset
-                    loaded_files = 0
-                    for file_path in valid_files:
-                        try:
-                            forecast_hour = int(str(file_path).split('_f')[-1].split('.')[0])
-                            ds = xr.open_dataset(
-                                file_path,
-                                engine='cfgrib',
-                                decode_timedelta=False,
-                                backend_kwargs={'indexpath': ''}
-                            )
-                            self._datasets[region_name][forecast_hour] = ds
-                            loaded_files += 1
-                        except Exception as e:
-                            logger.error(f"❌ Error loading wind file {file_path}: {str(e)}")
-                            continue
-                            
-                    if loaded_files > 0:
-                        logger.info(f"✅ Successfully loaded {loaded_files} wind files for {region_name}")
-                    else:
+                    grid = await self._build_region_grid(region_name, self.forecast_hours)
+                    if grid is None:
                         error_msg = f"Failed to load any wind files for {region_name}"
                         initialization_errors.append(error_msg)
                         logger.error(f"❌ {error_msg}")
+                        continue
+                        
+                    self._set_region_grid(region_name, grid)
                         
                 except Exception as e:
                     error_msg = f"Error initializing {region_name} wind data: {str(e)}"
@@ -160,7 +162,7 @@ class GFSWindClient:
                     logger.error(f"❌ {error_msg}")
                     continue
             
-            if initialization_errors and not any(self._datasets.values()):
+            if initialization_errors and not self._grids:
                 # Only fail initialization if we have no data at all
                 self._initialization_error = "; ".join(initialization_errors)
                 logger.error(f"❌ Wind initialization errors: {self._initialization_error}")
@@ -178,6 +180,163 @@ class GFSWindClient:
                 f"{self.model_run.date_str} {self.model_run.cycle_hour:02d}Z"
             )
 
+    async def _build_region_grid(self, region: str, forecast_hours: List[int]) -> Optional[ForecastGrid]:
+        """Load a region's valid files of these hours as a cube via the run's store."""
+        # Decode into the run's store once, later loads skip cfgrib entirely
+        store_path = await self.file_storage.build_store(
+            region,
+            self.model_run,
+            forecast_hours,
+            self._get_download_bounds(region)
+        )
+        if not store_path:
+            return None
+        return await run_in_decode_pool(
+            load_forecast_grid,
+            store_path,
+            self.WIND_VARIABLES,
+            settings.compact_grids
+        )
+
+    def _set_region_grid(self, region: str, grid: ForecastGrid) -> None:
+        """Index a region's loaded cube for its stations and start serving it."""
+        self._grids[region] = grid
+        self._station_indexes[region] = StationGridIndex.build(
+            grid.latitudes,
+            grid.longitudes,
+            self._get_region_stations(region)
+        )
+        self._station_tables[region] = grid.extract_stations(self._station_indexes[region])
+        logger.info(
+            f"✅ Successfully loaded {len(grid.times)} wind forecast hours for {region} "
+            f"({grid.nbytes / 1e6:.1f} MB) indexed for "
+            f"{len(self._station_indexes[region])} stations"
+        )
+    
+    async def restore(self) -> bool:
+        """Load the model run from its decoded stores on disk without contacting NOMADS.
+        
+        Returns False if any region's store is missing, unreadable or cropped to
+        other bounds than the region's current subregion. Hours the stores lack
+        are left for the backfill.
+        """
+        async with self._initialization_lock:
+            for region_name in settings.wind.regions:
+                store_path = self.file_storage.get_store_path(region_name, self.model_run)
+                if not has_bounds(store_path, self._get_download_bounds(region_name)):
+                    logger.warning(f"⚠️ No wind store cropped to the current bounds to restore for {region_name}")
+                    return False
+                grid = await run_in_decode_pool(
+                    load_forecast_grid,
+                    store_path,
+                    self.WIND_VARIABLES,
+                    settings.compact_grids
+                )
+                if grid is None:
+                    logger.warning(f"⚠️ No decoded wind store to restore for {region_name}")
+                    return False
+                self._set_region_grid(region_name, grid)
+                
+            self._is_initialized = True
+            logger.info(f"⚡ Restored wind model run {self.model_run} from disk")
+            return True
+
+    def get_expected_time(self, forecast_hour: int) -> datetime:
+        """Get when a forecast hour of the current run is expected on NOMADS.
+
+        GFS files become available progressively, with early hours first.
+        """
+        return self.model_run.available_time + timedelta(minutes=max(5, forecast_hour // 6))
+    
+    def _get_unloaded_hours(self, region: str) -> List[int]:
+        """Get forecast hours of the full run missing from a region's loaded cube.
+        
+        A region that failed to load at all is missing every hour.
+        """
+        if region not in self._grids:
+            return list(settings.wind.forecast_hours)
+        run_start = np.datetime64(
+            datetime.combine(self.model_run.run_date, time(hour=self.model_run.cycle_hour))
+        )
+        loaded = set(((self._grids[region].times - run_start) // np.timedelta64(1, "h")).tolist())
+        return [hour for hour in settings.wind.forecast_hours if hour not in loaded]
+    
+    def get_pending_hours(self) -> List[int]:
+        """Get forecast hours of the full run still missing from any region."""
+        pending = set()
+        for region in settings.wind.regions:
+            pending.update(self._get_unloaded_hours(region))
+        return sorted(pending)
+    
+    async def backfill(self, forecast_hours: List[int]) -> int:
+        """Download skipped or failed forecast hours and merge them into the loaded cubes.
+        
+        Returns the number of region forecast hours added.
+        """
+        added = 0
+        for region in settings.wind.regions:
+            try:
+                unloaded_hours = [hour for hour in self._get_unloaded_hours(region) if hour in forecast_hours]
+                if not unloaded_hours:
+                    continue
+                    
+                # Files already on disk, e.g. after a progressive start, only need loading
+                missing_files = self.file_storage.get_missing_files(
+                    region,
+                    self.model_run,
+                    unloaded_hours
+                )
+                if missing_files:
+                    await self._download_regional_files(region, missing_files)
+                    
+                new_hours = [
+                    hour for hour in unloaded_hours
+                    if self.file_storage.is_file_valid(
+                        self.model_run,
+                        self.file_storage.get_regional_file_path(region, self.model_run, hour)
+                    )
+                ]
+                if not new_hours:
+                    continue
+                    
+                grid = self._grids.get(region)
+                if grid is None:
+                    # Nothing loaded for the region yet, decode all its valid files
+                    grid = await self._build_region_grid(region, settings.wind.forecast_hours)
+                    if grid is None:
+                        continue
+                    self._set_region_grid(region, grid)
+                    added += len(new_hours)
+                    continue
+                    
+                new_grid = await self.file_storage.append_to_store(
+                    region,
+                    self.model_run,
+                    new_hours,
+                    self.WIND_VARIABLES,
+                    self._get_download_bounds(region),
+                    settings.compact_grids
+                )
+                
+                # Swap in the merged cube and its station table together
+                merged = grid.merge(new_grid)
+                self._station_tables[region] = merged.extract_stations(self._station_indexes[region])
+                self._grids[region] = merged
+                added += len(new_hours)
+                logger.info(
+                    f"🧩 Backfilled {len(new_hours)} wind forecast hours for {region}, "
+                    f"now {len(merged.times)} hours loaded"
+                )
+                
+            except Exception as e:
+                logger.error(f"❌ Error backfilling {region} wind data: {str(e)}")
+                
+        return added
+    
+    async def run_backfill(self, on_update: Callable[[], Awaitable[Any]]) -> bool:
+        """Backfill the run's missing hours as they become due, returning whether it was completed."""
+        return await run_forecast_backfill(self, "wind", on_update)
+
     async def _ensure_initialized(self):
         """Ensure the client is initialized before processing requests."""
         if not self._is_initialized:
@@ -206,6 +365,40 @@ class GFSWindClient:
             detail=f"Station coordinates ({lat}, {lon}) not within supported regions"
         )
     
+    def _get_region_stations(self, region: str) -> List[Station]:
+        """Get the stations served by a region."""
+        region_stations = []
+        for station in self.station_service.get_stations():
+            try:
+                station_region = self._get_region_for_station(
+                    station.location.coordinates[1],
+                    station.location.coordinates[0]
+                )
+            except HTTPException:
+                continue
+            if station_region == region:
+                region_stations.append(station)
+        return region_stations
+    
+    def _get_download_bounds(self, region: str) -> RegionGrid:
+        """Get the subregion downloaded for a region, covering its stations plus a margin."""
+        if region not in self._download_bounds:
+            region_grid = settings.wind.regions[region].grid
+            bounds = station_bounding_box(
+                self._get_region_stations(region),
+                region_grid,
+                settings.wind.subregion_margin
+            ) or region_grid
+            
+            region_area = (region_grid.lat.end - region_grid.lat.start) * (region_grid.lon.end - region_grid.lon.start)
+            area = (bounds.lat.end - bounds.lat.start) * (bounds.lon.end - bounds.lon.start)
+            logger.info(
+                f"📐 {region} wind subregion lat {bounds.lat.start}-{bounds.lat.end}, "
+                f"lon {bounds.lon.start}-{bounds.lon.end} ({area / region_area:.0%} of the region)"
+            )
+            self._download_bounds[region] = bounds
+        return self._download_bounds[region]
+    
     def _build_grib_filter_url(
         self,
         forecast_hour: int,
@@ -216,7 +409,7 @@ class GFSWindClient:
             raise ValueError("No model run available")
             
         region_config = settings.wind.regions[region]
-        bounds = region_config.grid
+        bounds = self._get_download_bounds(region)
         
         # Build the directory path and URL-encode it
         dir_path = f"/gfs.{self.model_run.date_str}/{self.model_run.cycle_hour:02d}/atmos"
@@ -255,47 +448,74 @@ class GFSWindClient:
         )
         return url
             
-    def _calculate_wind(self, u: float, v: float) -> tuple[float, float]:
-        """Calculate wind speed and direction from U and V components."""
-        try:
-            speed = round((u * u + v * v) ** 0.5, 2)
-            direction = round((270 - (180 / 3.14159) * (v > 0) * 3.14159 + (180 / 3.14159) * (v < 0) * 3.14159) % 360, 2)
-            return speed, direction
-        except Exception as e:
-            logger.error(f"Error calculating wind: {str(e)}")
+    def _get_station_points(self, station_id: str, station: Station) -> Tuple[List[WindForecastPoint], int]:
+        """Get a station's forecast points from this client's loaded run and the number of unusable hours."""
+        lat = station.location.coordinates[1]
+        lon = station.location.coordinates[0]
+        region = self._get_region_for_station(lat, lon)
+        
+        if region not in self._station_tables:
             raise HTTPException(
-                status_code=500,
-                detail=f"Error calculating wind data: {str(e)}"
+                status_code=503,
+                detail=f"No data available for region {region}"
             )
-            
-    def _process_grib_data(
+        
+        table = self._station_tables[region]
+        series = table.series(station_id)
+        if series is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Station {station_id} is not indexed for region {region}"
+            )
+        
+        speed_idx = table.variable_index("speed_mph")
+        direction_idx = table.variable_index("direction")
+        gust_idx = table.variable_index("gust")
+        
+        valid = ~np.isnan(series).any(axis=1)
+        failed_hours = int((~valid).sum())
+        
+        forecasts: List[WindForecastPoint] = [
+            WindForecastPoint(
+                time=pd.Timestamp(t).tz_localize('UTC').to_pydatetime(),
+                speed=round(float(values[speed_idx]), 2),
+                direction=round(float(values[direction_idx]), 2),
+                gust=UnitConversions.ms_to_mph(float(values[gust_idx]))
+            )
+            for t, values in zip(table.times[valid], series[valid])
+        ]
+        
+        return forecasts, failed_hours
+    
+    def _stitch_previous_run(
         self,
-        ds: xr.Dataset,
-        lat: float,
-        lon: float
-    ) -> Optional[Tuple[datetime, float, float, float]]:
-        """Process GRIB2 dataset and extract wind data for location."""
-        try:
-            valid_time = pd.to_datetime(ds.valid_time.item()).to_pydatetime()
-            if not isinstance(valid_time, datetime):
-                logger.error(f"Invalid time format from GRIB: {valid_time}")
-                return None
-            
-            if valid_time.tzinfo is None:
-                valid_time = valid_time.replace(tzinfo=timezone.utc)
+        station_id: str,
+        station: Station,
+        forecasts: List[WindForecastPoint]
+    ) -> List[ForecastSegment]:
+        """Append hours past this run's loaded forecast from the previous run."""
+        segments = []
+        if forecasts:
+            segments.append(ForecastSegment(
+                model_run=self.model_run,
+                start=forecasts[0].time,
+                end=forecasts[-1].time
+            ))
             
-            lat_idx = abs(ds.latitude - lat).argmin().item()
-            lon_idx = abs(ds.longitude - lon).argmin().item()
-            
-            u = float(ds['u10'].values[lat_idx, lon_idx])
-            v = float(ds['v10'].values[lat_idx, lon_idx])
-            gust = float(ds['gust'].values[lat_idx, lon_idx])
-            
-            return valid_time, u, v, gust
-            
-        except Exception as e:
-            logger.error(f"Error processing GRIB data: {str(e)}")
-            return None
+        if self.previous_client and forecasts:
+            try:
+                previous_forecasts, _ = self.previous_client._get_station_points(station_id, station)
+            except HTTPException:
+                previous_forecasts = []
+            later = [point for point in previous_forecasts if point.time > forecasts[-1].time]
+            if later:
+                forecasts.extend(later)
+                segments.append(ForecastSegment(
+                    model_run=self.previous_client.model_run,
+                    start=later[0].time,
+                    end=later[-1].time
+                ))
+        return segments
     
     async def get_station_wind_forecast(self, station_id: str, station: Station) -> WindForecastResponse:
         """Get wind forecast for a station using regional data."""
@@ -308,46 +528,10 @@ class GFSWindClient:
                     detail="No model cycle currently available"
                 )
             
-            lat = station.location.coordinates[1]
-            lon = station.location.coordinates[0]
-            region = self._get_region_for_station(lat, lon)
-            
-            if region not in self._datasets:
-                raise HTTPException(
-                    status_code=503,
-                    detail=f"No data available for region {region}"
-                )
+            forecasts, failed_hours = self._get_station_points(station_id, station)
             
-            forecasts: List[WindForecastPoint] = []
-            total_hours = 0
-            failed_hours = 0
-            
-            for hour in range(0, 385, 3):
-                try:
-                    if hour not in self._datasets[region]:
-                        logger.warning(f"Missing dataset for hour {hour}")
-                        failed_hours += 1
-                        continue
-                        
-                    ds = self._datasets[region][hour]
-                    wind_data = self._process_grib_data(ds, lat, lon)
-                    
-                    if wind_data:
-                        valid_time, u, v, gust = wind_data
-                        speed, direction = self._calculate_wind(u, v)
-                        
-                        forecasts.append(WindForecastPoint(
-                            time=valid_time,
-                            speed=UnitConversions.ms_to_mph(speed),
-                            direction=direction,
-                            gust=UnitConversions.ms_to_mph(gust)
-                        ))
-                        total_hours += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error processing hour {hour}: {str(e)}")
-                    failed_hours += 1
-                    continue
+            # Stitch later hours from the previous run while this one loads
+            segments = self._stitch_previous_run(station_id, station, forecasts)
             
             if not forecasts:
                 raise HTTPException(
@@ -357,7 +541,10 @@ class GFSWindClient:
             
             return WindForecastResponse(
                 station=station,
-                model_run=f"{self.model_run.date_str}_{self.model_run.cycle_hour:02d}Z",
+                model_run=describe_segments(
+                    segments,
+                    lambda run: f"{run.date_str}_{run.cycle_hour:02d}Z"
+                ),
                 forecasts=forecasts
             )
             
@@ -387,28 +574,51 @@ class GFSWindClient:
             logger.error(f"Error fetching {url}: {str(e)}")
             return None
 
-    async def _rate_limit(self):
-        """Implement rate limiting logic."""
-        now = datetime.now()
-        
-        # Reset counter if a minute has passed
-        if (now - self._last_request_time).total_seconds() >= 60:
-            self._request_count = 0
-            self._last_request_time = now
-            
-        # If we've hit our batch size, pause
-        if self._request_count > 0 and self._request_count % self.BATCH_SIZE == 0:
-            logger.info(f"⏸️ Pausing for {self.BATCH_PAUSE}s after batch of {self.BATCH_SIZE} requests...")
-            await asyncio.sleep(self.BATCH_PAUSE)
-            self._request_count = 0
-            self._last_request_time = datetime.now()
-            return
-            
-        # Otherwise, small delay between requests
-        if self._request_count > 0:
-            await asyncio.sleep(self.REQUEST_INTERVAL)
+    def _build_grib_file_url(self, forecast_hour: int) -> str:
+        """Build the direct URL of a global GRIB file in the NOMADS prod tree."""
+        cycle = f"{self.model_run.cycle_hour:02d}"
+        return (
+            f"{settings.base_url}/gfs.{self.model_run.date_str}/{cycle}/atmos/"
+            f"gfs.t{cycle}z.pgrb2.0p25.f{forecast_hour:03d}"
+        )
+    
+    def _get_index_messages(self, region: str) -> List[Tuple[str, str]]:
+        """Get the (variable, level) .idx messages for a region's configured fields."""
+        region_config = settings.wind.regions[region]
+        return [
+            (var, level.replace("_", " "))
+            for var in region_config.variables
+            for level in region_config.levels
+        ]
+    
+    async def _download_grib_messages(
+        self,
+        url: str,
+        file_path: Path,
+        messages: List[Tuple[str, str]]
+    ) -> bool:
+        """Download the wind messages of a GRIB file by byte range and save it."""
+        if self.file_storage.is_file_valid(self.model_run, file_path):
+            return True
             
-        self._request_count += 1
+        try:
+            async with aiohttp.ClientSession(
+                headers={'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'},
+                timeout=aiohttp.ClientTimeout(total=300)
+            ) as session:
+                ranges = await get_byte_ranges(session, url, messages)
+                if not ranges:
+                    return False
+                return await self.file_storage.save_stream(
+                    self.model_run,
+                    file_path,
+                    stream_byte_ranges(session, url, ranges),
+                    min_size=1000
+                )
+                
+        except Exception as e:
+            logger.error(f"Error downloading file by byte range: {str(e)}")
+            return False
 
     async def _download_grib_file(
         self,
@@ -416,12 +626,12 @@ class GFSWindClient:
         file_path: Path,
     ) -> bool:
         """Download a single GRIB file and save it."""
-        if self.file_storage.is_file_valid(file_path):
+        if self.file_storage.is_file_valid(self.model_run, file_path):
             return True
 
         try:
-            # Apply rate limiting before request
-            await self._rate_limit()
+            # Wait for a slot in the shared NOMADS budget
+            await nomads_rate_limiter.acquire()
             
             async with aiohttp.ClientSession(
                 cookies={'osCsid': 'dummy'},
@@ -435,14 +645,13 @@ class GFSWindClient:
                 logger.info(f"Attempting download from: {url}")
                 async with session.get(url, timeout=timeout) as response:
                     if response.status == 200:
-                        content = await response.read()
-                        content_size = len(content)
-                        logger.info(f"Downloaded {content_size} bytes")
-                        if content_size < 1000:  # Increased minimum size check
-                            logger.error(f"Downloaded file too small ({content_size} bytes), likely error page")
-                            return False
-                        if await self.file_storage.save_file(file_path, content):
-                            return True
+                        # Files under 1000 bytes are error pages
+                        return await self.file_storage.save_stream(
+                            self.model_run,
+                            file_path,
+                            response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE),
+                            min_size=1000
+                        )
                     else:
                         logger.error(f"Download failed with status {response.status}")
                         if response.status == 404:
@@ -465,8 +674,8 @@ class GFSWindClient:
         missing_files: List[Tuple[int, Path]]
     ) -> Tuple[int, int]:
         """Download missing files for a region."""
-        downloaded = failed = 0
         skipped = 0
+        available_files: List[Tuple[int, Path]] = []
         
         logger.info(f"Starting download of {len(missing_files)} files for {region}")
         
@@ -475,9 +684,7 @@ class GFSWindClient:
             if not self.model_run:
                 continue
                 
-            # Calculate the expected availability time for this forecast hour
-            # GFS files become available progressively, with early hours first
-            expected_time = self.model_run.available_time + timedelta(minutes=max(5, forecast_hour // 6))
+            expected_time = self.get_expected_time(forecast_hour)
             current_time = datetime.now(timezone.utc)
             
             if current_time < expected_time:
@@ -489,21 +696,29 @@ class GFSWindClient:
                 skipped += 1
                 continue
                 
-            # Log attempt with timing info
-            logger.info(
-                f"📥 Attempting forecast hour {forecast_hour} "
-                f"(expected since {expected_time.strftime('%H:%M:%S')} UTC, "
-                f"current time {current_time.strftime('%H:%M:%S')} UTC)"
-            )
-                
-            url = self._build_grib_filter_url(forecast_hour, region)
-            if await self._download_grib_file(url, file_path):
-                downloaded += 1
-            else:
-                failed += 1
-                
-            # Respect rate limit between downloads
-            await self._rate_limit()
+            available_files.append((forecast_hour, file_path))
+        
+        semaphore = asyncio.Semaphore(settings.nomads_rate_limit["max_concurrent_downloads"])
+        
+        async def download(forecast_hour: int, file_path: Path) -> bool:
+            async with semaphore:
+                logger.info(f"📥 Attempting forecast hour {forecast_hour}")
+                if settings.grib_download_mode == "byte_range":
+                    url = self._build_grib_file_url(forecast_hour)
+                    return await self._download_grib_messages(
+                        url,
+                        file_path,
+                        self._get_index_messages(region)
+                    )
+                url = self._build_grib_filter_url(forecast_hour, region)
+                return await self._download_grib_file(url, file_path)
+        
+        results = await asyncio.gather(*(
+            download(forecast_hour, file_path)
+            for forecast_hour, file_path in available_files
+        ))
+        downloaded = sum(1 for result in results if result)
+        failed = len(results) - downloaded
                 
         logger.info(
             f"Download summary for {region}:\n"
@@ -3,7 +3,6 @@ from typing import Dict, List
 from fastapi import HTTPException
 from datetime import datetime, timedelta, timezone
 import asyncio
-from aiocache import cached, SimpleMemoryCache
 
 from features.wind.models.wind_types import (
     WindForecastResponse
@@ -11,11 +10,8 @@ from features.wind.models.wind_types import (
 from features.wind.services.gfs_wind_client import GFSWindClient
 from features.stations.services.station_service import StationService
 from features.common.services.model_run_service import ModelRun
-from features.common.services.cache_config import (
-    MODEL_FORECAST_EXPIRE,
-    feature_cache_key_builder,
-    get_cache
-)
+from features.common.services.cache_config import ModelRunCache, model_run_cache_id
+from features.common.utils.forecast_window import get_window_start, trim_to_window
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +25,9 @@ class WindDataService:
         self.station_service = station_service
         self._initialization_lock = asyncio.Lock()
         self._is_initialized = False
-        self._cache = get_cache()
+        self._cache = ModelRunCache("wind_forecast")
+        if gfs_client.model_run:
+            self._cache.set_run(model_run_cache_id(gfs_client.model_run))
         
     async def initialize(self):
         """Initialize the wind data service."""
@@ -52,22 +50,65 @@ class WindDataService:
         self.gfs_client.update_model_run(model_run)
         self._is_initialized = False
         
-        # For now, just clear the entire cache on model run update
-        # This is safe because we're using SimpleMemoryCache
-        await self._cache.delete("wind_forecast:*")
-        logger.info("🗑️ Cleared wind forecast cache for new model run")
+        # Older runs' entries are no longer read and are evicted lazily
+        self._cache.set_run(model_run_cache_id(model_run))
+        logger.info(f"🗂️ Serving wind forecast cache generation {self._cache.run_id}")
         
         await self.initialize()
 
-    @cached(
-        ttl=MODEL_FORECAST_EXPIRE,
-        key_builder=feature_cache_key_builder,
-        namespace="wind_forecast",
-        cache=SimpleMemoryCache,
-        noself=True
-    )
-    async def get_station_forecast(self, station_id: str) -> WindForecastResponse:
-        """Get wind model forecast for a specific station."""
+    def use_model_run_cache(self, model_run: ModelRun):
+        """Serve cached forecasts of a model run primed by another worker."""
+        self._cache.set_run(model_run_cache_id(model_run))
+
+    async def prime_cache(self) -> int:
+        """Build and cache the forecast of every station with the current GFS client.
+        
+        Entries are written into the client's model run generation, which is served
+        once every station is primed so readers never see a half-built generation.
+        """
+        run_id = model_run_cache_id(self.gfs_client.model_run)
+        primed = 0
+        for station in self.station_service.get_stations():
+            try:
+                # Skip the cache lookup so the entry is rebuilt from the current client
+                await self.get_station_forecast(station.station_id, cache_read=False)
+                primed += 1
+            except HTTPException as e:
+                logger.debug(f"Skipping wind cache priming for station {station.station_id}: {e.detail}")
+            # Let in-flight requests run between stations
+            await asyncio.sleep(0)
+            
+        self._cache.set_run(run_id)
+        logger.info(f"🔥 Primed wind forecast cache for {primed} stations ({run_id})")
+        return primed
+
+    async def get_station_forecast(self, station_id: str, cache_read: bool = True) -> WindForecastResponse:
+        """Get wind model forecast for a specific station, cached per model run."""
+        if cache_read:
+            cached_response = await self._cache.get(station_id)
+            if cached_response is not None:
+                return trim_to_window(cached_response)
+                
+        # Workers that haven't loaded a run yet only serve what the ingesting worker primed
+        if not self.gfs_client.model_run:
+            raise HTTPException(
+                status_code=503,
+                detail="No model run loaded yet"
+            )
+                
+        # Key by the run the forecast was built from, so a concurrent run switch can't mislabel it,
+        # concurrent misses for the same station and run share a single build
+        run_id = model_run_cache_id(self.gfs_client.model_run)
+        
+        async def build_forecast() -> WindForecastResponse:
+            response = await self._build_station_forecast(station_id)
+            logger.info(f"Caching forecast for station {station_id} with key {self._cache.key(station_id, run_id)}")
+            return response
+            
+        return await self._cache.build(station_id, run_id, build_forecast)
+
+    async def _build_station_forecast(self, station_id: str) -> WindForecastResponse:
+        """Build the wind model forecast for a specific station."""
         try:
             if not self._is_initialized:
                 await self.initialize()
@@ -95,8 +136,7 @@ class WindDataService:
                 end_time = now + timedelta(days=7)
                 
                 # Round current time down to nearest 3-hour interval
-                now = now.replace(minute=0, second=0, microsecond=0)
-                now = now.replace(hour=(now.hour // 3) * 3)
+                now = get_window_start(now)
                 
                 # Filter forecasts to 7-day range and 3-hour intervals
                 filtered_forecasts = []
@@ -116,14 +156,6 @@ class WindDataService:
                     model_run=forecast.model_run
                 )
                 
-                # Log cache key for debugging
-                cache_key = feature_cache_key_builder(
-                    self.get_station_forecast,
-                    namespace="wind_forecast",
-                    station_id=station_id
-                )
-                logger.info(f"Caching forecast for station {station_id} with key {cache_key}")
-                
                 return response
                 
             except Exception as e:
@@ -0,0 +1,26 @@
+import numpy as np
+import xarray as xr
+
+from features.common.utils.conversions import UnitConversions
+
+# Fields derived from u10/v10 and stored alongside them
+DERIVED_WIND_VARIABLES = ["speed", "speed_mph", "direction"]
+
+def add_wind_fields(dataset: xr.Dataset) -> xr.Dataset:
+    """Add wind speed (m/s and mph) and direction grids computed from u10/v10.
+
+    Direction is meteorological: degrees clockwise from true north that the
+    wind blows from.
+    """
+    u = dataset["u10"].values.astype(np.float32)
+    v = dataset["v10"].values.astype(np.float32)
+    dims = dataset["u10"].dims
+
+    speed = np.hypot(u, v)
+    direction = np.mod(270.0 - np.degrees(np.arctan2(v, u)), 360.0).astype(np.float32)
+
+    return dataset.assign(
+        speed=(dims, speed, {"units": "m s**-1"}),
+        speed_mph=(dims, speed * np.float32(UnitConversions.MS_TO_MPH), {"units": "mph"}),
+        direction=(dims, direction, {"units": "degree true"})
+    )
@@ -1,13 +1,26 @@
 import os
+import sys
 import multiprocessing
 
+# Gunicorn loads this file by path, so make the app's packages importable
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.config import settings
+
 # Basic config
 host = os.getenv("HOST", "0.0.0.0")
 port = os.getenv("PORT", "5010")
 bind = f"{host}:{port}"
 
-# Force single worker mode for state management
-workers = 1
+# One worker per core when forecasts are shared through the Redis cache. With the
+# in-memory cache every worker would hold and prime its own copy, so keep one.
+# Either way only one worker downloads model runs (see settings.ingest_lock_path),
+# but each worker restores its own resident cubes and starts its own decode pool,
+# so memory scales with the worker count.
+if settings.cache["backend"] == "redis":
+    workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+else:
+    workers = 1
 worker_class = "uvicorn.workers.UvicornWorker"
 keepalive = 120
 timeout = int(os.getenv("TIMEOUT", "300"))
@@ -6,7 +6,7 @@ import os
 from contextlib import asynccontextmanager
 from datetime import datetime
 import asyncio
-from typing import Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from core.config import settings
 from core.logging_config import setup_logging
@@ -31,31 +31,127 @@ from features.wind.services.gfs_wind_client import GFSWindClient
 from features.common.services.model_run_service import ModelRunService
 from features.tides.services.tide_service import TideService
 from features.common.model_run import ModelRun
+from features.common.services.decode_pool import shutdown_decode_pool
+from features.common.services.cache_config import get_published_model_run, publish_model_run
+from features.common.utils.run_snapshot import RunSnapshot
+from features.common.utils.ingest_lock import IngestLock
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 class ModelRunState:
     """Class to manage model run state and clients."""
-    def __init__(self):
+    def __init__(self, station_service: StationService, snapshot: Optional[RunSnapshot] = None):
+        self.station_service = station_service
+        self.snapshot = snapshot
         self.current_model_run: Optional[ModelRun] = None
         self.gfs_client = None
         self.gfs_wave_client_v2 = None
         self.gfs_wind_client = None
+        self.background_tasks: List[asyncio.Task] = []
         
-    async def initialize(self, model_run: ModelRun):
-        """Initialize clients with model run."""
+    async def initialize(self, model_run: ModelRun, previous: Optional["ModelRunState"] = None):
+        """Initialize clients with model run.
+        
+        With progressive serving, only the early forecast hours are loaded here and
+        later hours are served from the `previous` state until the run completes.
+        """
+        progressive = previous is not None and settings.progressive_serving["enabled"]
         self.current_model_run = model_run
         self.gfs_client = NOAAGFSClient(model_run=model_run)
-        self.gfs_wave_client_v2 = GFSWaveClient(model_run=model_run)
-        self.gfs_wind_client = GFSWindClient(model_run=model_run)
+        self.gfs_wave_client_v2 = GFSWaveClient(
+            model_run=model_run,
+            station_service=self.station_service,
+            previous_client=previous.gfs_wave_client_v2 if progressive else None
+        )
+        self.gfs_wind_client = GFSWindClient(
+            model_run=model_run,
+            station_service=self.station_service,
+            previous_client=previous.gfs_wind_client if progressive else None
+        )
         
         # Initialize wave and wind data
         await self.gfs_wave_client_v2.initialize()
         await self.gfs_wind_client.initialize()
         
+    async def restore(self, model_run: ModelRun) -> bool:
+        """Restore clients for a model run from the decoded stores on disk, without network access."""
+        self.current_model_run = model_run
+        self.gfs_client = NOAAGFSClient(model_run=model_run)
+        self.gfs_wave_client_v2 = GFSWaveClient(
+            model_run=model_run,
+            station_service=self.station_service
+        )
+        self.gfs_wind_client = GFSWindClient(
+            model_run=model_run,
+            station_service=self.station_service
+        )
+        return await self.gfs_wave_client_v2.restore() and await self.gfs_wind_client.restore()
+        
+    def start_unloaded(self):
+        """Create clients without a model run, answering 503 until one is restored."""
+        self.gfs_client = NOAAGFSClient()
+        self.gfs_wave_client_v2 = GFSWaveClient(station_service=self.station_service)
+        self.gfs_wind_client = GFSWindClient(station_service=self.station_service)
+        
+    def save_snapshot(self):
+        """Point the snapshot at this run once every region holds all of its wave forecast hours."""
+        if self.snapshot and self.gfs_wave_client_v2.is_complete:
+            try:
+                self.snapshot.save(self.current_model_run)
+            except Exception as e:
+                logger.error(f"❌ Error saving run snapshot: {str(e)}")
+            self.cleanup_old_files()
+            
+    def cleanup_old_files(self):
+        """Delete files and stores of runs that are no longer served or restored.
+        
+        Keeps this run, the previous run it still stitches in and the snapshotted
+        run that other workers restore from disk.
+        """
+        keep_runs = [self.current_model_run]
+        for client in (self.gfs_wave_client_v2, self.gfs_wind_client):
+            if client.previous_client and client.previous_client.model_run:
+                keep_runs.append(client.previous_client.model_run)
+        snapshot_run = self.snapshot.load() if self.snapshot else None
+        if snapshot_run:
+            keep_runs.append(snapshot_run)
+        self.gfs_wave_client_v2.file_storage.cleanup_old_files(keep_runs)
+        self.gfs_wind_client.file_storage.cleanup_old_files(keep_runs)
+        
+    def start_background_loading(
+        self,
+        on_wave_update: Callable[[], Awaitable[Any]],
+        on_wind_update: Callable[[], Awaitable[Any]]
+    ):
+        """Start loading forecast hours still missing from this model run.
+        
+        The callbacks are awaited when new hours are loaded, e.g. to re-prime caches.
+        """
+        async def complete_waves():
+            if await self.gfs_wave_client_v2.run_backfill(on_wave_update):
+                self.save_snapshot()
+                
+        self.save_snapshot()
+
+        self.background_tasks = [
+            asyncio.create_task(complete_waves()),
+            asyncio.create_task(self.gfs_wind_client.run_backfill(on_wind_update))
+        ]
+        
     async def cleanup(self):
         """Cleanup clients."""
+        for task in self.background_tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        # Release the run this state was stitched from
+        if self.gfs_wave_client_v2:
+            self.gfs_wave_client_v2.previous_client = None
+        if self.gfs_wind_client:
+            self.gfs_wind_client.previous_client = None
         if self.gfs_wave_client_v2:
             await self.gfs_wave_client_v2.close()
 
@@ -68,17 +164,49 @@ async def lifespan(app: FastAPI):
         Path("downloaded_data/gfs_wave").mkdir(exist_ok=True)
         Path("downloaded_data/gfs_wind").mkdir(exist_ok=True)
 
-        # Initialize model run service and get latest cycle
+        # Station list is shared by the forecast clients for grid indexing
+        station_service = StationService()
+
         logger.info("\n📅 Initializing model run service...")
         model_run_service = ModelRunService()
-        current_model_run = await model_run_service.get_latest_available_cycle()
-        if not current_model_run:
-            logger.error("❌ Failed to get initial model run")
-            raise Exception("Failed to get initial model run")
+        run_snapshot = RunSnapshot(Path(settings.run_snapshot_path))
+        
+        # With several workers, the one holding the ingest lock downloads model runs
+        # and the others restore each run it completes from disk
+        ingest_lock = IngestLock(Path(settings.ingest_lock_path))
+        app.state.ingest_lock = ingest_lock
+        
+        async def download_latest_state() -> ModelRunState:
+            """Get the latest cycle and download it."""
+            current_model_run = await model_run_service.get_latest_available_cycle()
+            if not current_model_run:
+                logger.error("❌ Failed to get initial model run")
+                raise Exception("Failed to get initial model run")
+                
+            state = ModelRunState(station_service, run_snapshot)
+            await state.initialize(current_model_run)
+            return state
             
-        # Initialize active model run state
-        active_state = ModelRunState()
-        await active_state.initialize(current_model_run)
+        async def load_initial_state() -> ModelRunState:
+            """Restore the last fully loaded run from disk, or download the latest one."""
+            # Serve the snapshotted run straight from disk, newer runs are
+            # picked up by the model run check in the background
+            state = ModelRunState(station_service, run_snapshot)
+            snapshot_run = run_snapshot.load()
+            if snapshot_run and await state.restore(snapshot_run):
+                logger.info(f"⚡ Restored model run {snapshot_run} from snapshot")
+                return state
+                
+            if ingest_lock.try_acquire():
+                return await download_latest_state()
+                
+            # Don't hold up startup until the ingesting worker snapshots a complete run
+            logger.info("⏳ No model run on disk yet, serving what the ingesting worker primes")
+            state = ModelRunState(station_service, run_snapshot)
+            state.start_unloaded()
+            return state
+                
+        active_state = await load_initial_state()
         
         # Store services in app state
         app.state.model_run_service = model_run_service
@@ -86,7 +214,6 @@ async def lifespan(app: FastAPI):
         app.state.prefetch_state = None  # Will hold prefetched state
             
         # Initialize services
-        station_service = StationService()
         buoy_client = NDBCBuoyClient()
         
         # Store other services in app state
@@ -116,15 +243,18 @@ async def lifespan(app: FastAPI):
             """Prefetch data for new model run in background."""
             try:
                 logger.info(f"🔄 Prefetching data for new model run {new_model_run.date_str} {new_model_run.cycle_hour:02d}Z")
-                new_state = ModelRunState()
-                await new_state.initialize(new_model_run)
+                new_state = ModelRunState(station_service, run_snapshot)
+                await new_state.initialize(new_model_run, previous=app.state.active_state)
                 return new_state
             except Exception as e:
                 logger.error(f"❌ Error prefetching new model run: {str(e)}")
                 return None
                 
-        async def switch_model_run(new_state: ModelRunState):
-            """Switch to new model run state."""
+        async def switch_model_run(new_state: ModelRunState, ingest: bool = True):
+            """Switch to new model run state.
+            
+            Workers that don't ingest runs read the caches primed by the one that does.
+            """
             try:
                 old_state = app.state.active_state
                 
@@ -133,8 +263,24 @@ async def lifespan(app: FastAPI):
                 app.state.wave_service_v2.gfs_client = new_state.gfs_wave_client_v2
                 app.state.wind_service.gfs_client = new_state.gfs_wind_client
                 
+                if ingest:
+                    # Rebuild every station's forecast into the new run's cache generation,
+                    # the old run's entries keep serving until priming switches generations
+                    logger.info("🔥 Priming forecast caches for new model run...")
+                    await app.state.wave_service_v2.prime_cache()
+                    await app.state.wind_service.prime_cache()
+                    await publish_model_run(new_state.current_model_run)
+                else:
+                    await follow_published_run(new_state.current_model_run)
+                
                 # Switch active state
                 app.state.active_state = new_state
+                if ingest:
+                    new_state.start_background_loading(
+                        app.state.wave_service_v2.prime_cache,
+                        app.state.wind_service.prime_cache
+                    )
+                    new_state.cleanup_old_files()
                 
                 # Cleanup old state
                 await old_state.cleanup()
@@ -147,31 +293,96 @@ async def lifespan(app: FastAPI):
         async def check_model_runs():
             while True:
                 try:
-                    new_model_run = await model_run_service.get_latest_available_cycle()
                     current_run = app.state.active_state.current_model_run
+                    new_model_run = await model_run_service.wait_for_new_run(current_run)
                     
-                    if new_model_run and (
-                        new_model_run.run_date != current_run.run_date or 
-                        new_model_run.cycle_hour != current_run.cycle_hour
-                    ):
-                        # Start prefetching if not already in progress
-                        if not app.state.prefetch_state:
-                            logger.info("🔄 New model run detected, starting prefetch...")
-                            app.state.prefetch_state = await prefetch_new_model_run(new_model_run)
+                    # Start prefetching if not already in progress
+                    if not app.state.prefetch_state:
+                        logger.info("🔄 New model run detected, starting prefetch...")
+                        app.state.prefetch_state = await prefetch_new_model_run(new_model_run)
+                        
+                        if app.state.prefetch_state:
+                            # Switch to new model run
+                            await switch_model_run(app.state.prefetch_state)
+                            app.state.prefetch_state = None
+                            continue
                             
-                            if app.state.prefetch_state:
-                                # Switch to new model run
-                                await switch_model_run(app.state.prefetch_state)
-                                app.state.prefetch_state = None
-                                
+                except asyncio.CancelledError:
+                    raise
                 except Exception as e:
                     logger.error(f"❌ Error checking for new model run: {str(e)}")
-                finally:
-                    # Check every 15 minutes
-                    await asyncio.sleep(900)
                     
-        # Start model run check task
-        app.state.model_run_task = asyncio.create_task(check_model_runs())
+                # Back off before retrying a run that could not be loaded
+                await asyncio.sleep(settings.model_run_polling["retry_seconds"])
+                    
+        async def follow_published_run(fallback: Optional[ModelRun] = None):
+            """Serve the cache generation the ingesting worker last primed, or the fallback run's."""
+            model_run = await get_published_model_run() or fallback
+            if model_run:
+                app.state.wave_service_v2.use_model_run_cache(model_run)
+                app.state.wind_service.use_model_run_cache(model_run)
+                
+        async def ingest_model_runs():
+            """Complete the active run, then download each new run as it is published."""
+            if app.state.active_state.current_model_run:
+                await publish_model_run(app.state.active_state.current_model_run)
+                # Fill in forecast hours that weren't published yet, re-priming the caches as they land
+                app.state.active_state.start_background_loading(
+                    app.state.wave_service_v2.prime_cache,
+                    app.state.wind_service.prime_cache
+                )
+                
+            # Taking over before any run was loaded, download the latest one first
+            while not app.state.active_state.current_model_run:
+                try:
+                    await switch_model_run(await download_latest_state())
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"❌ Error loading initial model run: {str(e)}")
+                    await asyncio.sleep(settings.model_run_polling["retry_seconds"])
+                    
+            await check_model_runs()
+            
+        def start_observation_polling():
+            """Poll NDBC observations in this worker, the others read them from the shared cache."""
+            app.state.observation_task = asyncio.create_task(station_service.poll_observations())
+            
+        async def follow_model_runs():
+            """Follow the runs the ingesting worker primes and restore those it completes, taking over if it exits."""
+            while True:
+                await asyncio.sleep(settings.ingest_follow_seconds)
+                try:
+                    if ingest_lock.try_acquire():
+                        logger.info("👑 Taking over model run ingestion")
+                        start_observation_polling()
+                        await ingest_model_runs()
+                        return
+                        
+                    snapshot_run = run_snapshot.load()
+                    current_run = app.state.active_state.current_model_run
+                    if snapshot_run and (current_run is None or snapshot_run.is_newer_than(current_run)):
+                        new_state = ModelRunState(station_service, run_snapshot)
+                        if await new_state.restore(snapshot_run):
+                            await switch_model_run(new_state, ingest=False)
+                            
+                    # Switch generations as soon as a run is primed, its snapshot
+                    # follows only once all of its hours are loaded
+                    await follow_published_run()
+                            
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"❌ Error following model runs: {str(e)}")
+                    
+        # Start model run check and observation polling tasks
+        if ingest_lock.try_acquire():
+            app.state.model_run_task = asyncio.create_task(ingest_model_runs())
+            start_observation_polling()
+        else:
+            logger.info("👀 Another worker is ingesting model runs, following its snapshots")
+            await follow_published_run()
+            app.state.model_run_task = asyncio.create_task(follow_model_runs())
         
         logger.info("\n✨ API startup complete - ready to serve requests")
         yield
@@ -189,6 +400,19 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 pass
             
+        if hasattr(app.state, "observation_task"):
+            app.state.observation_task.cancel()
+            try:
+                await app.state.observation_task
+            except asyncio.CancelledError:
+                pass
+            
+        if hasattr(app.state, "station_service"):
+            await app.state.station_service.buoy_client.close()
+            
+        if hasattr(app.state, "model_run_service"):
+            await app.state.model_run_service.close()
+            
         # Cleanup active state
         if hasattr(app.state, "active_state"):
             await app.state.active_state.cleanup()
@@ -197,6 +421,11 @@ async def lifespan(app: FastAPI):
         if hasattr(app.state, "prefetch_state") and app.state.prefetch_state:
             await app.state.prefetch_state.cleanup()
             
+        shutdown_decode_pool()
+        
+        if hasattr(app.state, "ingest_lock"):
+            app.state.ingest_lock.release()
+            
         logger.info("👋 API shutdown complete")
 
 app = FastAPI(
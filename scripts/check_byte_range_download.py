@@ -0,0 +1,114 @@
+import sys
+import asyncio
+import logging
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from features.common.services.grib_byte_range import get_byte_ranges, stream_byte_ranges
+from features.common.utils.grib_manifest import GribStreamInspector
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# (variable, level) of each message in the stand-in GRIB file, in file order
+MESSAGES = [
+    ("HTSGW", "surface"),
+    ("PERPW", "surface"),
+    ("WIND", "surface"),
+    ("DIRPW", "surface"),
+]
+WANTED = [("HTSGW", "surface"), ("PERPW", "surface"), ("DIRPW", "surface")]
+
+def make_message(payload: bytes) -> bytes:
+    """Build a minimal GRIB2 message: indicator section, payload and end marker."""
+    length = 16 + len(payload) + 4
+    return b"GRIB" + b"\x00\x00\x00\x02" + length.to_bytes(8, "big") + payload + b"7777"
+
+def write_stand_in(directory: Path) -> bytes:
+    """Write a GRIB file with its .idx sidecar, returning the bytes of the wanted messages."""
+    grib = b""
+    index_lines = []
+    wanted = b""
+    for number, (variable, level) in enumerate(MESSAGES, start=1):
+        message = make_message(variable.encode() * 50)
+        index_lines.append(f"{number}:{len(grib)}:d=2026101612:{variable}:{level}:anl:")
+        grib += message
+        if (variable, level) in WANTED:
+            wanted += message
+
+    (directory / "test.grib2").write_bytes(grib)
+    (directory / "test.grib2.idx").write_text("\n".join(index_lines) + "\n")
+    return wanted
+
+async def download(url: str) -> bytes:
+    """Download the wanted messages by byte range, checking the result is complete GRIB."""
+    inspector = GribStreamInspector()
+    content = b""
+    async with aiohttp.ClientSession() as session:
+        ranges = await get_byte_ranges(session, url, WANTED)
+        async for chunk in stream_byte_ranges(session, url, ranges):
+            inspector.update(chunk)
+            content += chunk
+    inspector.finish()
+    return content
+
+async def check_ranged_server(directory: Path, expected: bytes) -> bool:
+    """A server honouring Range must yield exactly the wanted messages."""
+    app = web.Application()
+    app.router.add_static("/", directory)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        content = await download(f"http://127.0.0.1:{port}/test.grib2")
+    finally:
+        await runner.cleanup()
+
+    if content != expected:
+        logger.error(f"❌ Ranged server: got {len(content)} bytes, expected {len(expected)}")
+        return False
+    logger.info(f"✅ Ranged server: downloaded only the {len(WANTED)} wanted messages")
+    return True
+
+async def check_rangeless_server(directory: Path) -> bool:
+    """A server ignoring Range (200 with the whole file) must fail the download."""
+    handler = partial(SimpleHTTPRequestHandler, directory=str(directory))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        await download(f"http://127.0.0.1:{server.server_port}/test.grib2")
+    except ValueError as e:
+        logger.info(f"✅ Rangeless server: download refused ({e})")
+        return True
+    finally:
+        server.shutdown()
+
+    logger.error("❌ Rangeless server: whole-file replies were accepted")
+    return False
+
+async def main() -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        expected = write_stand_in(directory)
+        results = [
+            await check_ranged_server(directory, expected),
+            await check_rangeless_server(directory),
+        ]
+    return all(results)
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
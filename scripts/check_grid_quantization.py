@@ -0,0 +1,140 @@
+import sys
+import logging
+from pathlib import Path
+from typing import Tuple
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from features.common.utils.forecast_grid import (
+    QUANTIZATION,
+    QUANTIZATION_PERIOD,
+    ForecastGrid,
+    dequantize,
+    quantize
+)
+from features.common.utils.grib_store import open_store
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Stores decoded by the wave and wind clients
+DEFAULT_STORES = ["downloaded_data/gfs_wave", "downloaded_data/gfs_wind"]
+
+# Ranges of the synthetic values checked for each variable
+SYNTHETIC_RANGES = {
+    "swh": (0.0, 20.0),
+    "perpw": (0.0, 30.0),
+    "dirpw": (0.0, 360.0),
+    "speed_mph": (0.0, 200.0),
+    "direction": (0.0, 360.0),
+    "gust": (0.0, 100.0),
+}
+# Edge cases added to the synthetic values, as (value, whether it must survive encoding)
+SYNTHETIC_EDGES = {
+    "periodic": [(0.0, True), (359.96, True), (360.0, True), (-0.03, True), (1e9, False), (-1e9, False)],
+    "linear": [(0.0, True), (1e9, False), (-1.0, False)],
+}
+
+def compare(name: str, expected: np.ndarray, actual: np.ndarray) -> Tuple[bool, float, float]:
+    """Compare decoded values with their float64 reference, returning (ok, max error, tolerance).
+
+    Missing values must stay missing and nothing else may become missing.
+    """
+    scale = QUANTIZATION[name][0]
+    missing_match = np.array_equal(np.isnan(expected), np.isnan(actual))
+    valid = ~np.isnan(expected)
+    difference = np.abs(expected[valid] - actual[valid])
+    period = QUANTIZATION_PERIOD.get(name)
+    if period is not None:
+        # 359.96 and 0.0 degrees are 0.04 apart, not 359.96
+        difference = np.mod(difference, period)
+        difference = np.minimum(difference, period - difference)
+    error = difference.max() if valid.any() else 0.0
+    # Half a quantization step, plus float32 rounding of the decoded values
+    tolerance = scale / 2 + 2 * np.abs(expected[valid]).max(initial=0) * np.finfo(np.float32).eps
+    return missing_match and error <= tolerance, error, tolerance
+
+def check_synthetic() -> bool:
+    """Round-trip generated values of every quantized variable against float64, without any data."""
+    rng = np.random.default_rng(0)
+    passed = True
+    for name, (low, high) in SYNTHETIC_RANGES.items():
+        scale, offset = QUANTIZATION[name]
+        period = QUANTIZATION_PERIOD.get(name)
+        edges = SYNTHETIC_EDGES["periodic" if period is not None else "linear"]
+
+        values = np.concatenate([
+            rng.uniform(low, high, 100_000),
+            [value for value, _ in edges],
+            [np.nan]
+        ])
+        expected = values.copy()
+        # Out-of-range values must become missing rather than wrap or saturate
+        expected[len(values) - 1 - len(edges):-1] = [value if kept else np.nan for value, kept in edges]
+
+        encoded = quantize(values, scale, offset, period=period)
+        actual = dequantize(
+            encoded[:, np.newaxis],
+            np.array([scale]),
+            np.array([offset])
+        )[:, 0].astype(np.float64)
+
+        ok, error, tolerance = compare(name, expected, actual)
+        passed = passed and ok
+        logger.info(
+            f"  {'✅' if ok else '❌'} synthetic {name}: max error {error:.6f} (tolerance {tolerance:.6f})"
+        )
+    return passed
+
+def check_store(store_path: Path) -> bool:
+    """Compare a store's compact grid with its values read as float64, variable by variable."""
+    dataset = open_store(store_path)
+    if dataset is None:
+        logger.error(f"Could not open {store_path}")
+        return False
+
+    variables = [name for name in QUANTIZATION if name in dataset.data_vars]
+    if not variables:
+        logger.info(f"Skipping {store_path.name}: no quantized variables")
+        return True
+
+    dataset = dataset.sortby("time")
+    full = ForecastGrid.from_dataset(dataset, variables)
+    compact = ForecastGrid.from_dataset(dataset, variables, compact=True)
+    decoded = dequantize(compact.values, compact.scales, compact.offsets).astype(np.float64)
+
+    passed = True
+    logger.info(
+        f"{store_path.name}: {full.nbytes / 1e6:.1f} MB float32 -> {compact.nbytes / 1e6:.1f} MB compact"
+    )
+    for i, name in enumerate(variables):
+        expected = dataset[name].transpose("time", "latitude", "longitude").values.astype(np.float64)
+        ok, error, tolerance = compare(name, expected, decoded[..., i])
+        passed = passed and ok
+        logger.info(f"  {'✅' if ok else '❌'} {name}: max error {error:.6f} (tolerance {tolerance:.6f})")
+    return passed
+
+def main():
+    """Check synthetic values, then every Zarr store under the given directories (default: downloaded data)."""
+    results = [check_synthetic()]
+
+    directories = [Path(arg) for arg in sys.argv[1:]] or [Path(d) for d in DEFAULT_STORES]
+    store_paths = sorted(
+        path for directory in directories if directory.exists() for path in directory.glob("*.zarr")
+    )
+    if not store_paths:
+        logger.info("No Zarr stores found, checked synthetic values only")
+    results.extend(check_store(path) for path in store_paths)
+
+    if all(results):
+        print("✅ Compact grids are within half a quantization step of float64")
+    else:
+        print("❌ Compact grids differ from float64 beyond tolerance")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()